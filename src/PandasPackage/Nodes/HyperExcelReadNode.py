@@ -5,6 +5,7 @@ from uflow.Core import NodeBase
 from uflow.Core.NodeBase import NodePinsSuggestionsHelper
 from uflow.Core.Common import *
 from uflow import getPinDefaultValueByType
+from ..Pins import DATAFRAME_PIN
 
 
 class HyperExcelRead(NodeBase):
@@ -92,20 +93,20 @@ class HyperExcelRead(NodeBase):
         # Get current output pin names (excluding ExecPin)
         current_pin_names = {
             pin.name for pin in self.outputs.values() 
-            if pin.dataType == "DataFramePin"
+            if pin.dataType == DATAFRAME_PIN
         }
         
         # Remove default "data" pin if sheets are detected
         if sheet_names:
             default_pin = self.getPinByName("data")
-            if default_pin and default_pin.dataType == "DataFramePin":
+            if default_pin and default_pin.dataType == DATAFRAME_PIN:
                 default_pin.kill()
                 # Remove from current_pin_names set
                 current_pin_names.discard("data")
         else:
             # No sheets, ensure default "data" pin exists
             default_pin = self.getPinByName("data")
-            if not default_pin or default_pin.dataType != "DataFramePin":
+            if not default_pin or default_pin.dataType != DATAFRAME_PIN:
                 # Create default "data" pin if it doesn't exist
                 self.defaultOutput = self.createOutputPin(
                     "data",
@@ -130,7 +131,7 @@ class HyperExcelRead(NodeBase):
         pins_to_remove = current_pin_names - new_pin_names - {"data"}
         for pin_name in pins_to_remove:
             pin = self.getPinByName(pin_name)
-            if pin and pin.dataType == "DataFramePin":
+            if pin and pin.dataType == DATAFRAME_PIN:
                 pin.kill()
         
         # Create new pins that don't exist yet
@@ -4,24 +4,25 @@ DataFrame preview dialog with advanced table features.
 Uses Qt Model/View architecture for better performance with large datasets.
 """
 
-from qtpy import QtWidgets, QtCore
-import pandas as pd
+from qtpy import QtWidgets
 from ._dialog_persistence import PersistentGeometryDialogMixin
-from ._pandas_table_model import PandasTableModel
 from .DataFrameViewerWidget import DataFrameViewerWidget
 
 
 class DataFrameDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
-    """Dialog for displaying DataFrame with pagination, sorting, and filtering."""
+    """Dialog for displaying DataFrame with pagination, sorting, and filtering.
+
+    表格、分页、搜索与统计由内嵌的 DataFrameViewerWidget 提供，
+    对话框只负责窗口、导出与关闭按钮。
+    """
 
     def __init__(self, dataframe=None, pin_name="data", parent=None):
         super(DataFrameDialog, self).__init__(parent)
         self.pin_name = pin_name
-        self.original_dataframe = dataframe if dataframe is not None else pd.DataFrame()
-        # 保留原 settings，Mixin 会优先使用此实例
-        self.settings = QtCore.QSettings("uflow", "DataFrameDialog")
+        # 同类对话框共享同一 QSettings 实例，Mixin 会优先使用此实例
+        self.settings = self.sharedSettings()
         self.setupUI()
-        self.setDataFrame(self.original_dataframe)
+        self.setDataFrame(dataframe)
         # 统一通过 Mixin 恢复几何信息
         self.restoreWindowGeometry()
 
@@ -32,80 +33,11 @@ class DataFrameDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
 
         layout = QtWidgets.QVBoxLayout(self)
 
-        # Info bar
-        infoLayout = QtWidgets.QHBoxLayout()
-
-        self.infoLabel = QtWidgets.QLabel("No data")
-        self.infoLabel.setStyleSheet("font-weight: bold; color: #666;")
-        infoLayout.addWidget(self.infoLabel)
-
-        infoLayout.addStretch()
-
-        # 分页控件
-        paginationLayout = QtWidgets.QHBoxLayout()
-        paginationLayout.addWidget(QtWidgets.QLabel("每页行数:"))
-
-        self.pageSizeCombo = QtWidgets.QComboBox()
-        self.pageSizeCombo.addItems(["10", "50", "100", "500", "全部"])
-        self.pageSizeCombo.setCurrentIndex(0)  # 默认 10 行
-        self.pageSizeCombo.currentIndexChanged.connect(self.onPageSizeChanged)
-        paginationLayout.addWidget(self.pageSizeCombo)
-
-        self.prevPageBtn = QtWidgets.QPushButton("◀")
-        self.prevPageBtn.setMaximumWidth(30)
-        self.prevPageBtn.clicked.connect(self.onPrevPage)
-        paginationLayout.addWidget(self.prevPageBtn)
-
-        self.pageLabel = QtWidgets.QLabel("1/1")
-        paginationLayout.addWidget(self.pageLabel)
-
-        self.nextPageBtn = QtWidgets.QPushButton("▶")
-        self.nextPageBtn.setMaximumWidth(30)
-        self.nextPageBtn.clicked.connect(self.onNextPage)
-        paginationLayout.addWidget(self.nextPageBtn)
-
-        infoLayout.addLayout(paginationLayout)
-
-        # Search box
-        self.searchBox = QtWidgets.QLineEdit()
-        self.searchBox.setPlaceholderText("Search in table...")
-        self.searchBox.setMaximumWidth(200)
-        self.searchBox.textChanged.connect(self.onSearchChanged)
-        infoLayout.addWidget(QtWidgets.QLabel("Search:"))
-        infoLayout.addWidget(self.searchBox)
-
-        layout.addLayout(infoLayout)
-
-        # Table view with model
-        self.model = PandasTableModel()
-        self.proxyModel = QtCore.QSortFilterProxyModel()
-        self.proxyModel.setSourceModel(self.model)
-        self.proxyModel.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
-
-        self.tableView = QtWidgets.QTableView()
-        self.tableView.setModel(self.proxyModel)
-        self.tableView.setSortingEnabled(True)
-        self.tableView.setAlternatingRowColors(True)
-        self.tableView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.tableView.horizontalHeader().setStretchLastSection(True)
-        self.tableView.verticalHeader().setDefaultSectionSize(24)
-
-        layout.addWidget(self.tableView)
-
-        # Statistics panel (collapsible)
-        self.statsGroup = QtWidgets.QGroupBox("Statistics")
-        self.statsGroup.setCheckable(True)
-        self.statsGroup.setChecked(False)
-        statsLayout = QtWidgets.QVBoxLayout()
-
-        self.statsText = QtWidgets.QTextEdit()
-        self.statsText.setReadOnly(True)
-        self.statsText.setMaximumHeight(150)
-        statsLayout.addWidget(self.statsText)
-
-        self.statsGroup.setLayout(statsLayout)
-        self.statsGroup.toggled.connect(self.onStatsToggled)
-        layout.addWidget(self.statsGroup)
+        # Viewer with pagination/search/statistics
+        self.viewer = DataFrameViewerWidget()
+        self.viewer.searchBox.setPlaceholderText("Search in table...")
+        self.viewer.searchBox.setMaximumWidth(200)
+        layout.addWidget(self.viewer)
 
         # Bottom buttons
         buttonLayout = QtWidgets.QHBoxLayout()
@@ -124,89 +56,18 @@ class DataFrameDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
 
     def setDataFrame(self, dataframe):
         """Set the DataFrame to display."""
-        if dataframe is None or dataframe.empty:
-            self.original_dataframe = pd.DataFrame()
-            self.model.setDataFrame(self.original_dataframe)
-            self.infoLabel.setText("No data")
-            self.statsText.clear()
-            return
+        self.viewer.setDataFrame(dataframe)
+        self.original_dataframe = self.viewer.getDataFrame()
 
-        self.original_dataframe = dataframe.copy()
-        self.model.setDataFrame(self.original_dataframe)
-
-        # Update info
-        rows, cols = dataframe.shape
-        memory_usage = dataframe.memory_usage(deep=True).sum() / 1024 / 1024  # MB
-        self.infoLabel.setText(
-            f"Shape: {rows:,} rows × {cols} columns | Memory: {memory_usage:.2f} MB"
-        )
-
-        # Auto-resize columns
-        self.tableView.resizeColumnsToContents()
-
-        # Update statistics if panel is open
-        if self.statsGroup.isChecked():
-            self.updateStatistics()
-
-        # 更新分页 UI
-        self.updatePaginationUI()
-
-    def onPageSizeChanged(self, index):
-        """处理每页行数变化"""
-        page_sizes = [10, 50, 100, 500, -1]  # -1 表示全部
-        page_size = page_sizes[index]
-        self.model.setPageSize(page_size)
-        self.updatePaginationUI()
-
-    def onPrevPage(self):
-        """上一页"""
-        current = self.model.getCurrentPage()
-        if current > 0:
-            self.model.setCurrentPage(current - 1)
-            self.updatePaginationUI()
-
-    def onNextPage(self):
-        """下一页"""
-        current = self.model.getCurrentPage()
-        total = self.model.getTotalPages()
-        if current < total - 1:
-            self.model.setCurrentPage(current + 1)
-            self.updatePaginationUI()
-
-    def updatePaginationUI(self):
-        """更新分页 UI 状态"""
-        current = self.model.getCurrentPage()
-        total = self.model.getTotalPages()
-        
-        self.pageLabel.setText(f"{current + 1}/{total}")
-        
-        # 显示全部时禁用翻页按钮
-        show_all = self.model.getPageSize() == -1
-        self.prevPageBtn.setEnabled(not show_all and current > 0)
-        self.nextPageBtn.setEnabled(not show_all and current < total - 1)
-
-    def onSearchChanged(self, text):
-        """Handle search text changes."""
-        # Apply filter to all columns
-        self.proxyModel.setFilterFixedString(text)
-
-    def onStatsToggled(self, checked):
-        """Handle statistics panel toggle."""
-        if checked:
-            self.updateStatistics()
-
-    def updateStatistics(self):
-        """Update the statistics panel."""
-        if self.original_dataframe.empty:
-            self.statsText.setText("No data to analyze")
-            return
+    def setPinName(self, pin_name):
+        """更新引脚名及窗口标题（对话框被复用于同类引脚时调用）。"""
+        if pin_name != self.pin_name:
+            self.pin_name = pin_name
+            self.setWindowTitle(f"DataFrame Viewer - {pin_name}")
 
-        try:
-            # Generate statistics
-            stats = self.original_dataframe.describe(include="all").to_string()
-            self.statsText.setText(stats)
-        except Exception as e:
-            self.statsText.setText(f"Error generating statistics: {e}")
+    def getDataFrame(self):
+        """Get the current DataFrame."""
+        return self.original_dataframe
 
     def exportToCSV(self):
         """Export the DataFrame to CSV file."""
@@ -242,8 +103,8 @@ class MultiDataFrameDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
         """
         super(MultiDataFrameDialog, self).__init__(parent)
         self.dataframes = dataframes_dict
-        # 保留原 settings，Mixin 会优先使用此实例
-        self.settings = QtCore.QSettings("uflow", "MultiDataFrameDialog")
+        # 同类对话框共享同一 QSettings 实例，Mixin 会优先使用此实例
+        self.settings = self.sharedSettings()
         self.setupUI()
         # 统一通过 Mixin 恢复几何信息
         self.restoreWindowGeometry()
@@ -258,11 +119,12 @@ class MultiDataFrameDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
         # Tab widget for multiple DataFrames
         self.tabWidget = QtWidgets.QTabWidget()
 
-        for pin_name, dataframe in self.dataframes.items():
-            # Create a dedicated viewer widget with pagination/search/statistics
-            viewer = DataFrameViewerWidget()
-            viewer.setDataFrame(dataframe if dataframe is not None else pd.DataFrame())
-            self.tabWidget.addTab(viewer, pin_name)
+        # {pin_name: DataFrameViewerWidget}
+        self.viewers = {}
+        self.updateDataFrames(self.dataframes)
+
+        # 共享模型的分页状态可能已在其他标签页改变，切换时刷新分页控件
+        self.tabWidget.currentChanged.connect(self.onTabChanged)
 
         layout.addWidget(self.tabWidget)
 
@@ -276,4 +138,52 @@ class MultiDataFrameDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
 
         layout.addLayout(buttonLayout)
 
+    def updateDataFrames(self, dataframes_dict):
+        """按引脚名原地更新各标签页：已有标签页复用其 viewer，只为新引脚建页、为消失的引脚删页。
+
+        同一 DataFrame 对象以多个引脚名出现时（如查看管线的多个阶段），
+        各标签页共享同一个表格模型，只复制并缓存一次数据。
+        """
+        self.dataframes = dataframes_dict
+        self.tabWidget.setUpdatesEnabled(False)
+        try:
+            for pin_name in self.viewers.keys() - dataframes_dict.keys():
+                viewer = self.viewers.pop(pin_name)
+                self.tabWidget.removeTab(self.tabWidget.indexOf(viewer))
+                viewer.deleteLater()
+
+            owner_by_id = {}
+            # 本轮已被某个数据源占用的模型 {id(model): viewer}
+            claimed = {}
+            for pin_name, dataframe in dataframes_dict.items():
+                viewer = self.viewers.get(pin_name)
+                owner = owner_by_id.get(id(dataframe)) if dataframe is not None else None
+                if owner is not None:
+                    if viewer is None:
+                        viewer = DataFrameViewerWidget(model=owner.model)
+                        self.tabWidget.addTab(viewer, pin_name)
+                        self.viewers[pin_name] = viewer
+                    viewer.shareDataFrame(owner)
+                    continue
+
+                if viewer is None:
+                    viewer = DataFrameViewerWidget()
+                    self.tabWidget.addTab(viewer, pin_name)
+                    self.viewers[pin_name] = viewer
+                elif id(viewer.model) in claimed:
+                    # 原先共享的模型已用于另一份数据：换用独立模型，避免互相覆盖
+                    viewer._detachSharedModel()
+                claimed[id(viewer.model)] = viewer
+                viewer.setDataFrame(dataframe)
+                if dataframe is not None:
+                    owner_by_id[id(dataframe)] = viewer
+        finally:
+            self.tabWidget.setUpdatesEnabled(True)
+
+    def onTabChanged(self, index):
+        """刷新当前标签页的分页控件。"""
+        viewer = self.tabWidget.widget(index)
+        if viewer is not None:
+            viewer.updatePaginationUI()
+
     # 几何信息保存/恢复逻辑由 Mixin 统一处理
@@ -5,17 +5,42 @@ Reusable widget extracted from DataFrameDialog with advanced table features.
 Uses Qt Model/View architecture for better performance with large datasets.
 """
 
-from qtpy import QtWidgets, QtCore, QtGui
+from qtpy import QtWidgets, QtCore
 import pandas as pd
-from ._pandas_table_model import PandasTableModel
+from ._pandas_table_model import PandasTableModel, PYARROW_AVAILABLE, has_object_columns, memory_usage_mb, snapshot, to_arrow_strings
+from ._search_index import SearchIndex
+from ._background import BackgroundRunner
+from ._fast_describe import describe_text
+
+
+# 立即按内容调整宽度的列数，其余列在事件循环空闲时再调整
+_EAGER_RESIZE_COLUMNS = 20
+# “显示全部”模式下测量列宽时采样的行数
+_RESIZE_SAMPLE_ROWS = 50
+# 超过该单元格数（行 × 列）的表不按内容测量列宽，改用固定默认宽度
+_RESIZE_MAX_CELLS = 50_000
+_DEFAULT_COLUMN_WIDTH = 120
+# 无数据时显示的共享空表；模型只读，约定任何地方都不得原地修改
+_EMPTY_DF = pd.DataFrame()
 
 
 class DataFrameViewerWidget(QtWidgets.QWidget):
     """Widget for displaying DataFrame with search, sorting, and statistics."""
 
-    def __init__(self, parent=None):
+    # 每页行数选项（-1 表示全部），同时决定下拉框的选项文字
+    _PAGE_SIZES = (10, 50, 100, 500, -1)
+
+    def __init__(self, parent=None, model=None):
+        """
+        Args:
+            model: 可选的共享 PandasTableModel；多个视图显示同一 DataFrame 时复用同一模型
+        """
         super(DataFrameViewerWidget, self).__init__(parent)
-        self.original_dataframe = pd.DataFrame()
+        self.original_dataframe = _EMPTY_DF
+        self._sharedModel = model
+        # 模型是否被多个视图共享；搜索会替换模型数据，共享时需先换用独立模型
+        self._modelShared = model is not None
+        self.settings = QtCore.QSettings("uflow", "DataFrameViewerWidget")
         self.setupUI()
 
     def setupUI(self):
@@ -37,7 +62,7 @@ class DataFrameViewerWidget(QtWidgets.QWidget):
         paginationLayout.addWidget(QtWidgets.QLabel("每页行数:"))
 
         self.pageSizeCombo = QtWidgets.QComboBox()
-        self.pageSizeCombo.addItems(["10", "50", "100", "500", "全部"])
+        self.pageSizeCombo.addItems([str(n) if n > 0 else "全部" for n in self._PAGE_SIZES])
         self.pageSizeCombo.setCurrentIndex(0)  # 默认 10 行
         self.pageSizeCombo.currentIndexChanged.connect(self.onPageSizeChanged)
         paginationLayout.addWidget(self.pageSizeCombo)
@@ -57,6 +82,21 @@ class DataFrameViewerWidget(QtWidgets.QWidget):
 
         infoLayout.addLayout(paginationLayout)
 
+        # 可选：将字符串列转换为 Arrow 存储（加速显示与搜索）
+        self.arrowCheckBox = QtWidgets.QCheckBox("Arrow strings (faster)")
+        self.arrowCheckBox.setToolTip(
+            "Convert string columns to string[pyarrow] for faster display and search"
+            if PYARROW_AVAILABLE
+            else "pyarrow is not installed"
+        )
+        self.arrowCheckBox.setEnabled(PYARROW_AVAILABLE)
+        self.arrowCheckBox.setChecked(
+            # 安装了 pyarrow 时默认开启：字符串列在载入时一次性转换
+            PYARROW_AVAILABLE and self.settings.value("arrowStrings", True, type=bool)
+        )
+        self.arrowCheckBox.toggled.connect(self.onArrowStringsToggled)
+        infoLayout.addWidget(self.arrowCheckBox)
+
         # Search box
         self.searchBox = QtWidgets.QLineEdit()
         self.searchBox.setPlaceholderText("Search...")
@@ -68,18 +108,32 @@ class DataFrameViewerWidget(QtWidgets.QWidget):
         layout.addLayout(infoLayout)
 
         # Table view with model
-        self.model = PandasTableModel()
-        self.proxyModel = QtCore.QSortFilterProxyModel()
-        self.proxyModel.setSourceModel(self.model)
-        self.proxyModel.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.model = self._sharedModel if self._sharedModel is not None else PandasTableModel()
+        # 不使用代理模型：搜索过滤与排序都在 pandas 中完成（见 PandasTableModel.sort）
+        # 未过滤的显示数据；搜索索引按它懒构建，数据变化时失效
+        self._displayFrame = self.model.getDataFrame()
+        self._searchIndex = None
+
+        # 搜索防抖：停止输入 150ms 后才执行过滤
+        self._searchTimer = QtCore.QTimer(self)
+        self._searchTimer.setSingleShot(True)
+        self._searchTimer.setInterval(150)
+        self._searchTimer.timeout.connect(self._applySearch)
+        # 待执行与已生效的搜索文本（小写）；相同则跳过重复过滤
+        self._pendingSearch = ""
+        self._appliedSearch = None
 
         self.tableView = QtWidgets.QTableView()
-        self.tableView.setModel(self.proxyModel)
+        self.tableView.setModel(self.model)
+        # 先清除排序指示，避免启用排序时立即按第 0 列排序
+        self.tableView.horizontalHeader().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
         self.tableView.setSortingEnabled(True)
         self.tableView.setAlternatingRowColors(True)
         self.tableView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.tableView.horizontalHeader().setStretchLastSection(True)
         self.tableView.verticalHeader().setDefaultSectionSize(24)
+        # 固定行高：Qt 无需逐行测量高度
+        self.tableView.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
 
         layout.addWidget(self.tableView)
 
@@ -95,44 +149,152 @@ class DataFrameViewerWidget(QtWidgets.QWidget):
         statsLayout.addWidget(self.statsText)
 
         self.statsGroup.setLayout(statsLayout)
+
+        # 统计在后台线程计算，结果经排队信号回到 GUI 线程
+        self._statsRunner = BackgroundRunner(self)
+        self._statsRunner.finished.connect(self.statsText.setText)
+        self._statsRunner.failed.connect(self._onStatisticsFailed)
+        # 面板内容是否已过期（数据变化后尚未重新计算）
+        self._statsDirty = True
+
+        # 深度内存统计（逐个 Python 对象计数）同样放到后台
+        self._memoryRunner = BackgroundRunner(self)
+        self._memoryRunner.finished.connect(self._onDeepMemoryReady)
         self.statsGroup.toggled.connect(self.onStatsToggled)
         layout.addWidget(self.statsGroup)
 
     def setDataFrame(self, dataframe):
         """Set the DataFrame to display."""
         if dataframe is None or dataframe.empty:
-            self.original_dataframe = pd.DataFrame()
-            self.model.setDataFrame(self.original_dataframe)
+            self.original_dataframe = _EMPTY_DF
+            self._memoryRunner.cancel()
+            self._setModelDataFrame(self.original_dataframe)
             self.infoLabel.setText("No data")
+            self._statsRunner.cancel()
             self.statsText.clear()
+            self._statsDirty = True
             return
 
-        self.original_dataframe = dataframe.copy()
-        self.model.setDataFrame(self.original_dataframe)
+        self.original_dataframe = snapshot(dataframe)
+        display = self._displayDataFrame(self.original_dataframe)
+        # 无搜索过滤且形状/列/dtype 均未变（如数据流刷新）时原地更新模型，
+        # 保留页码与列宽，无需重置模型或重新测量列宽
+        in_place = not self._pendingSearch and self.model.isCompatible(display)
+        if in_place:
+            self._displayFrame = display
+            self._searchIndex = None
+            self.model.updateDataFrame(display)
+        else:
+            self._setModelDataFrame(display)
 
         # Update info
-        rows, cols = dataframe.shape
-        memory_usage = dataframe.memory_usage(deep=True).sum() / 1024 / 1024  # MB
-        self.infoLabel.setText(
-            f"Shape: {rows:,} rows × {cols} columns | "
-            f"Memory: {memory_usage:.2f} MB"
-        )
+        # 先显示浅统计的内存估算（≈），含 object 列时再在后台做深度统计
+        deep_pending = has_object_columns(dataframe)
+        self._setInfoText(memory_usage_mb(dataframe), approximate=deep_pending)
+        if deep_pending:
+            self._memoryRunner.submit(memory_usage_mb, dataframe, True)
+        else:
+            self._memoryRunner.cancel()
 
         # Auto-resize columns
-        self.tableView.resizeColumnsToContents()
+        if not in_place:
+            self._resizeColumns()
 
-        # Update statistics if panel is open
-        if self.statsGroup.isChecked():
-            self.updateStatistics()
+        # Statistics are recomputed now if the panel is open, otherwise on next expand
+        self._invalidateStatistics()
 
         # 更新分页 UI
         self.updatePaginationUI()
 
+    def shareDataFrame(self, other):
+        """与另一个使用同一模型的视图共享数据，不复制 DataFrame、不重置模型。
+
+        外部修改该 DataFrame 后，所有共享视图都会失效；对共享模型调用
+        `model.setDataFrame(...)` 即可一次性刷新全部视图。
+        若本视图当前使用的不是 `other` 的模型，则改用该模型。
+        """
+        if self.model is not other.model:
+            self.model = other.model
+            self.tableView.setModel(other.model)
+        self._modelShared = True
+        other._modelShared = True
+        self.original_dataframe = other.original_dataframe
+        self._displayFrame = other._displayFrame
+        self._searchIndex = other._searchIndex
+        self.infoLabel.setText(other.infoLabel.text())
+        self._resizeColumns()
+        self.updatePaginationUI()
+
+    def _resizeColumns(self):
+        """按内容调整列宽：只采样有限行，并优先调整前几列。
+
+        大表（超过 _RESIZE_MAX_CELLS 个单元格）不测量内容，直接使用固定默认列宽。
+        """
+        rows, cols = self.original_dataframe.shape
+        if rows * cols > _RESIZE_MAX_CELLS:
+            header = self.tableView.horizontalHeader()
+            header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+            header.setDefaultSectionSize(_DEFAULT_COLUMN_WIDTH)
+            return
+        page_size = self.model.getPageSize()
+        self.tableView.horizontalHeader().setResizeContentsPrecision(
+            page_size if page_size > 0 else _RESIZE_SAMPLE_ROWS
+        )
+        for column in range(min(self.model.columnCount(), _EAGER_RESIZE_COLUMNS)):
+            self.tableView.resizeColumnToContents(column)
+        if self.model.columnCount() > _EAGER_RESIZE_COLUMNS:
+            QtCore.QTimer.singleShot(0, self._resizeRemainingColumns)
+
+    def _resizeRemainingColumns(self):
+        for column in range(_EAGER_RESIZE_COLUMNS, self.model.columnCount()):
+            self.tableView.resizeColumnToContents(column)
+
+    def _setInfoText(self, memory_mb, approximate=False):
+        rows, cols = self.original_dataframe.shape
+        prefix = "≈" if approximate else ""
+        self.infoLabel.setText(
+            f"Shape: {rows:,} rows × {cols} columns | Memory: {prefix}{memory_mb:.2f} MB"
+        )
+
+    def _onDeepMemoryReady(self, memory_mb):
+        self._setInfoText(memory_mb)
+
+    def _setModelDataFrame(self, dataframe):
+        """更新显示数据，并按当前搜索文本重新过滤后交给模型。"""
+        self._displayFrame = dataframe
+        self._searchIndex = None
+        self._searchTimer.stop()
+        self._pendingSearch = self.searchBox.text()
+        self._appliedSearch = None
+        self._applySearch()
+
+    def _detachSharedModel(self):
+        """换用独立模型（保留当前页大小），之后的过滤不再影响其他共享视图。"""
+        model = PandasTableModel()
+        model.setPageSize(self.model.getPageSize())
+        header = self.tableView.horizontalHeader()
+        model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        self.model = model
+        self.tableView.setModel(model)
+        self._modelShared = False
+
+    def _displayDataFrame(self, dataframe):
+        """返回用于模型显示的 DataFrame（按需转换为 Arrow 字符串，原始数据保持不变）。"""
+        if self.arrowCheckBox.isChecked():
+            return to_arrow_strings(dataframe)
+        return dataframe
+
+    def onArrowStringsToggled(self, checked):
+        """切换 Arrow 字符串转换，并记住用户选择。"""
+        self.settings.setValue("arrowStrings", checked)
+        if not self.original_dataframe.empty:
+            self._setModelDataFrame(self._displayDataFrame(self.original_dataframe))
+            self.updatePaginationUI()
+            self._invalidateStatistics()
+
     def onPageSizeChanged(self, index):
         """处理每页行数变化"""
-        page_sizes = [10, 50, 100, 500, -1]  # -1 表示全部
-        page_size = page_sizes[index]
-        self.model.setPageSize(page_size)
+        self.model.setPageSize(self._PAGE_SIZES[index])
         self.updatePaginationUI()
 
     def onPrevPage(self):
@@ -168,27 +330,56 @@ class DataFrameViewerWidget(QtWidgets.QWidget):
 
     def onSearchChanged(self, text):
         """Handle search text changes."""
-        # Apply filter to all columns
-        self.proxyModel.setFilterFixedString(text)
+        # Debounced: the filter runs once typing pauses
+        self._pendingSearch = text
+        self._searchTimer.start()
+
+    def _applySearch(self):
+        """用搜索索引计算行掩码，只把匹配的行交给模型。"""
+        text = self._pendingSearch
+        # 搜索不区分大小写：输入后又删回原文本、仅改变大小写时无需重新过滤
+        if text.lower() == self._appliedSearch:
+            return
+        self._appliedSearch = text.lower()
+        if not text:
+            self.model.setDataFrame(self._displayFrame)
+            self.updatePaginationUI()
+            return
+        if self._searchIndex is None:
+            self._searchIndex = SearchIndex(self._displayFrame)
+        if self._modelShared:
+            self._detachSharedModel()
+        self.model.setDataFrame(self._displayFrame[self._searchIndex.mask(text)])
+        self.updatePaginationUI()
 
     def onStatsToggled(self, checked):
         """Handle statistics panel toggle."""
-        if checked:
+        # 折叠期间数据未变化时，重新展开直接沿用已有结果
+        if checked and self._statsDirty:
+            self.updateStatistics()
+
+    def _invalidateStatistics(self):
+        """标记统计已过期；面板展开时立即重新计算。"""
+        self._statsDirty = True
+        if self.statsGroup.isChecked():
             self.updateStatistics()
 
     def updateStatistics(self):
-        """Update the statistics panel."""
+        """Update the statistics panel (computed in the background)."""
+        self._statsDirty = False
         if self.original_dataframe.empty:
+            self._statsRunner.cancel()
             self.statsText.setText("No data to analyze")
             return
 
-        try:
-            # Generate statistics
-            stats = self.original_dataframe.describe(include='all').to_string()
-            self.statsText.setText(stats)
-        except Exception as e:
-            self.statsText.setText(f"Error generating statistics: {e}")
+        self.statsText.setText("Computing statistics...")
+        # 使用显示数据：Arrow 字符串列的 unique/top/freq 在 C++ 中计算
+        self._statsRunner.submit(describe_text, self._displayFrame)
+
+    def _onStatisticsFailed(self, message):
+        self.statsText.setText(f"Error generating statistics: {message}")
+        self._statsDirty = True
 
     def clear(self):
         """Clear the viewer."""
-        self.setDataFrame(pd.DataFrame())
+        self.setDataFrame(None)
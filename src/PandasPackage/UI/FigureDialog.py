@@ -4,7 +4,7 @@ Single Figure preview dialog for matplotlib Figure objects.
 Simplified dialog for displaying a single Figure with interactive features.
 """
 
-from qtpy import QtWidgets, QtCore, QtGui
+from qtpy import QtWidgets, QtCore
 from .PlotViewerWidget import PlotViewerWidget
 from ._dialog_persistence import PersistentGeometryDialogMixin
 
@@ -20,9 +20,12 @@ class FigureDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
 
     变更点：
     - 继承 PersistentGeometryDialogMixin 统一管理窗口几何信息保存/恢复。
-    - 在 closeEvent 中先清理 PlotViewerWidget（断开 matplotlib 回调），再交由 Mixin 保存 geometry。
+    - 在 closeEvent 中先清理 PlotViewerWidget（断开 matplotlib 回调），geometry 由 Mixin 在 finished 时保存。
     """
 
+    # 关闭时是否清理 PlotViewerWidget；被节点复用的对话框设为 False，关闭只隐藏
+    releaseOnClose = True
+
     def __init__(self, figure=None, pin_name="figure", parent=None):
         super(FigureDialog, self).__init__(parent)
         self.pin_name = pin_name
@@ -63,19 +66,31 @@ class FigureDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
         if self.plotViewer:
             self.plotViewer.setFigure(figure)
 
+    def setPinName(self, pin_name):
+        """更新引脚名及窗口标题（对话框被复用于同类引脚时调用）。"""
+        if pin_name != self.pin_name:
+            self.pin_name = pin_name
+            self.setWindowTitle(f"Figure Viewer - {pin_name}")
+
     def getFigure(self):
         """Get the current Figure."""
         return self.current_figure
 
     def closeEvent(self, event):
-        """关闭时先清理 PlotViewerWidget，再交由 Mixin 保存窗口几何信息。"""
-        # 先确保嵌入的 PlotViewerWidget 断开回调并清理
+        """关闭时先清理 PlotViewerWidget；窗口几何信息由 Mixin 在 finished 时保存。
+
+        对话框被复用（`releaseOnClose` 为 False）时只隐藏，保留当前 Figure，
+        持有者销毁前将其恢复为 True 再关闭，由 `releaseViewers` 清理。
+        """
+        if self.releaseOnClose:
+            self.releaseViewers()
+        # QDialog.closeEvent 会触发 reject -> finished，由 Mixin 统一保存 geometry
+        super(FigureDialog, self).closeEvent(event)
+
+    def releaseViewers(self):
+        """清理嵌入的 PlotViewerWidget，断开 matplotlib 回调。"""
         try:
             if hasattr(self, "plotViewer") and self.plotViewer:
                 self.plotViewer.clear()
         except Exception:
             pass
-        # 调用 Mixin 的 closeEvent（通过 super）统一保存 geometry
-        super(FigureDialog, self).closeEvent(event)
-
-
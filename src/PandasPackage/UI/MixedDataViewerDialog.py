@@ -5,18 +5,18 @@ Uses tabs to organize multiple pins, with each tab displaying the appropriate
 viewer based on data type (DataFrame -> table, Figure -> plot).
 """
 
+import gc
+from collections import namedtuple
+from contextlib import contextmanager
+
 from qtpy import QtWidgets, QtCore
-import pandas as pd
 from .DataFrameViewerWidget import DataFrameViewerWidget
-from .PlotViewerWidget import PlotViewerWidget
 from ._dialog_persistence import PersistentGeometryDialogMixin
 from ..Pins import DATAFRAME_PIN, MPL_FIGURE_PIN
 
-try:
-    import matplotlib.figure
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+
+# 每个引脚标签页的记录：widget 为 None 表示尚未构建；plot 为 Figure 标签页内的 PlotViewerWidget
+_TabEntry = namedtuple("_TabEntry", "pin_type widget plot")
 
 
 class MixedDataViewerDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
@@ -27,17 +27,25 @@ class MixedDataViewerDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
     - 使用集中常量 `DATAFRAME_PIN` 与 `MPL_FIGURE_PIN`，避免魔法字符串。
     """
 
-    def __init__(self, pins_data_dict, parent=None):
+    # 每种引脚类型最多保留的可复用 viewer 数量
+    _POOL_SIZE = 4
+
+    # 关闭时是否清理 viewer；被节点复用的对话框设为 False，关闭只隐藏
+    releaseOnClose = True
+
+    def __init__(self, pins_data_dict, parent=None, interactive_figures=True):
         """
         Args:
             pins_data_dict: dict of {pin_name: (pin_type, data)}
                 pin_type: "DataFramePin" or "MatplotlibFigurePin"
                 data: pandas.DataFrame or matplotlib.figure.Figure
+            interactive_figures: False 时 Figure 以静态位图显示（无画布与工具栏）
         """
         super(MixedDataViewerDialog, self).__init__(parent)
         self.pins_data = pins_data_dict
-        # 保留原 settings，Mixin 会优先使用此实例
-        self.settings = QtCore.QSettings("uflow", "MixedDataViewerDialog")
+        self._interactiveFigures = interactive_figures
+        # 同类对话框共享同一 QSettings 实例（按类名缓存），Mixin 会优先使用此实例
+        self.settings = self.sharedSettings()
         self.setupUI()
         self.restoreWindowGeometry()
 
@@ -52,12 +60,37 @@ class MixedDataViewerDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
         self.tabWidget = QtWidgets.QTabWidget()
 
         # Store references to viewer widgets for updates
+        # {pin_name: _TabEntry}；尚未构建的标签页 widget 为 None，其数据与占位控件保存在 _pending 中
         self.viewer_widgets = {}
+        self._pending = {}
+        # 不可见标签页的待刷新数据 {pin_name: (pin_type, data)}，切换到该页时才应用
+        self._dirty_data = {}
+        # 标签页控件 -> 索引，随增删同步维护，代替 QTabWidget.indexOf 的线性查找
+        self._widget_to_index = {}
+        # 被移除或因类型变化被替换的 viewer，按引脚类型缓存以供复用 {pin_type: [_TabEntry]}
+        self._widget_pool = {DATAFRAME_PIN: [], MPL_FIGURE_PIN: []}
 
-        for pin_name, (pin_type, data) in self.pins_data.items():
-            widget = self._createTabWidget(pin_name, pin_type, data)
-            self.tabWidget.addTab(widget, pin_name)
-            self.viewer_widgets[pin_name] = (pin_type, widget)
+        # Figure 更新合并：16ms 内的多次更新只在定时器触发时各应用一次
+        self._pendingFigures = {}
+        self._redrawTimer = QtCore.QTimer(self)
+        self._redrawTimer.setSingleShot(True)
+        self._redrawTimer.setInterval(16)
+        self._redrawTimer.timeout.connect(self._flushFigureRedraws)
+
+        # updateAllPins 限流：每帧（约 16ms）最多应用一次，期间只保留最新的一份数据；
+        # 上一次应用耗时超过一帧时，下一次相应推迟
+        self._pendingPins = None
+        self._updateTimer = QtCore.QTimer(self)
+        self._updateTimer.setSingleShot(True)
+        self._updateTimer.setInterval(16)
+        self._updateTimer.timeout.connect(self._applyPendingUpdates)
+
+        # 标签页按需构建：先插入空占位控件，首次切换到该标签页时才创建真正的 viewer
+        # 批量结束时只构建初始可见的标签页
+        with self._batchTabChanges():
+            for pin_name, (pin_type, data) in self.pins_data.items():
+                self._addPlaceholderTab(pin_name, pin_type, data)
+        self.tabWidget.currentChanged.connect(self._onCurrentTabChanged)
 
         layout.addWidget(self.tabWidget)
 
@@ -71,12 +104,131 @@ class MixedDataViewerDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
 
         layout.addLayout(buttonLayout)
 
+    @contextmanager
+    def _batchTabChanges(self):
+        """批量增删标签页：期间暂停重绘并屏蔽信号，结束后只布局、绘制一次。
+
+        批量期间 currentChanged 被屏蔽，结束后补建/刷新当前标签页。
+        """
+        self.tabWidget.setUpdatesEnabled(False)
+        was_blocked = self.tabWidget.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.tabWidget.blockSignals(was_blocked)
+            self.tabWidget.setUpdatesEnabled(True)
+        self._onCurrentTabChanged(self.tabWidget.currentIndex())
+
+    def _addPlaceholderTab(self, pin_name, pin_type, data):
+        """添加占位标签页，记录待构建的数据。"""
+        placeholder = QtWidgets.QWidget()
+        placeholder._pinName = pin_name
+        self._widget_to_index[placeholder] = self.tabWidget.addTab(placeholder, pin_name)
+        self.viewer_widgets[pin_name] = _TabEntry(pin_type, None, None)
+        self._pending[pin_name] = (pin_type, data, placeholder)
+
+    def _removePinTab(self, pin_name):
+        """移除引脚对应的标签页（已构建的 viewer 或占位控件）。"""
+        entry = self.viewer_widgets.pop(pin_name)
+        self._dirty_data.pop(pin_name, None)
+        self._pendingFigures.pop(pin_name, None)
+        if entry.widget is None:
+            placeholder = self._pending.pop(pin_name)[2]
+            self._removeTab(placeholder)
+            placeholder.deleteLater()
+            return
+        self._removeTab(entry.widget)
+        self._recycle(entry)
+
+    def _recycle(self, entry):
+        """把已移出标签页的 viewer 清空后放入复用池；池满时销毁最旧的一个。"""
+        entry.widget.setParent(None)
+        pool = self._widget_pool.get(entry.pin_type)
+        if pool is None:
+            entry.widget.deleteLater()
+            return
+        # 释放对旧数据的引用
+        if entry.plot is not None:
+            entry.plot.clear()
+        else:
+            entry.widget.clear()
+        pool.append(entry)
+        if len(pool) > self._POOL_SIZE:
+            pool.pop(0).widget.deleteLater()
+
+    def _removeTab(self, widget):
+        """移除控件所在的标签页，并把其后各页的索引减一。"""
+        index = self._widget_to_index.pop(widget, -1)
+        if index < 0:
+            return
+        self.tabWidget.removeTab(index)
+        for other, other_index in self._widget_to_index.items():
+            if other_index > index:
+                self._widget_to_index[other] = other_index - 1
+
+    def _replaceTab(self, index, old_widget, new_widget, pin_name):
+        """在同一位置用新控件替换旧控件，其他标签页索引不变。"""
+        self.tabWidget.removeTab(index)
+        self.tabWidget.insertTab(index, new_widget, pin_name)
+        del self._widget_to_index[old_widget]
+        self._widget_to_index[new_widget] = index
+
+    def _onCurrentTabChanged(self, index):
+        """切换标签页：按需构建占位页，并应用积压的数据更新。"""
+        self._ensureTabBuilt(index)
+        self._flushDirty(index)
+
+    def _flushDirty(self, index):
+        """若 `index` 处标签页有积压的更新，立即应用。"""
+        pin_name = getattr(self.tabWidget.widget(index), "_pinName", None)
+        if pin_name in self._dirty_data:
+            pin_type, data = self._dirty_data.pop(pin_name)
+            self.setPinData(pin_name, pin_type, data)
+
+    def _ensureTabBuilt(self, index):
+        """若 `index` 处仍是占位控件，则创建真正的 viewer 并替换之。"""
+        if index < 0:
+            return
+        pin_name = getattr(self.tabWidget.widget(index), "_pinName", None)
+        if pin_name is None or pin_name not in self._pending:
+            return
+        pin_type, data, placeholder = self._pending.pop(pin_name)
+        entry = self._createTabEntry(pin_name, pin_type, data)
+        widget = entry.widget
+        # 替换期间屏蔽 currentChanged，避免 removeTab/insertTab 递归触发构建
+        was_blocked = self.tabWidget.blockSignals(True)
+        try:
+            self._replaceTab(index, placeholder, widget, pin_name)
+            self.tabWidget.setCurrentIndex(index)
+        finally:
+            self.tabWidget.blockSignals(was_blocked)
+        placeholder.deleteLater()
+        self.viewer_widgets[pin_name] = entry
+
+    def _createTabEntry(self, pin_name, pin_type, data):
+        """创建标签页控件（优先复用池中的 viewer），并返回对应的 _TabEntry。"""
+        pool = self._widget_pool.get(pin_type)
+        if pool:
+            entry = pool.pop()
+            if entry.plot is not None:
+                entry.plot.setFigure(data)
+            else:
+                entry.widget.setDataFrame(data)
+            entry.widget._pinName = pin_name
+            return entry
+
+        plot = None
+        if pin_type == MPL_FIGURE_PIN:
+            widget, plot = self._createFigureTab(pin_name, data)
+        else:
+            widget = self._createTabWidget(pin_name, pin_type, data)
+        widget._pinName = pin_name
+        return _TabEntry(pin_type, widget, plot)
+
     def _createTabWidget(self, pin_name, pin_type, data):
-        """Create a widget for a single pin based on its type."""
+        """Create a widget for a single non-figure pin based on its type."""
         if pin_type == DATAFRAME_PIN:
             return self._createDataFrameTab(pin_name, data)
-        elif pin_type == MPL_FIGURE_PIN:
-            return self._createFigureTab(pin_name, data)
         else:
             # Unknown type - show error message
             widget = QtWidgets.QWidget()
@@ -91,87 +243,160 @@ class MixedDataViewerDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
     def _createDataFrameTab(self, pin_name, dataframe):
         """Create a tab widget for DataFrame display using reusable viewer widget."""
         viewer = DataFrameViewerWidget()
-        viewer.setDataFrame(dataframe if dataframe is not None else pd.DataFrame())
+        viewer.setDataFrame(dataframe)
         return viewer
 
     def _createFigureTab(self, pin_name, figure):
-        """Create a tab widget for Figure display."""
+        """Create a tab widget for Figure display; returns (widget, plotViewer)."""
         widget = QtWidgets.QWidget()
         tabLayout = QtWidgets.QVBoxLayout(widget)
         tabLayout.setContentsMargins(0, 0, 0, 0)
 
-        # Use PlotViewerWidget for consistent display
-        plotViewer = PlotViewerWidget()
+        if self._interactiveFigures:
+            # 延迟导入：只显示 DataFrame 的对话框无需加载 matplotlib 及其 Qt 后端
+            from .PlotViewerWidget import PlotViewerWidget
+            # Use PlotViewerWidget for consistent display
+            plotViewer = PlotViewerWidget()
+        else:
+            # 纯查看：Agg 栅格化后以位图显示
+            from ._static_figure import StaticFigureView
+            plotViewer = StaticFigureView()
         plotViewer.setFigure(figure)
         tabLayout.addWidget(plotViewer)
 
-        # Store viewer reference for updates
-        widget._plotViewer = plotViewer
-
-        return widget
+        return widget, plotViewer
 
     def setPinData(self, pin_name, pin_type, data):
         """Update data for a specific pin."""
         if pin_name not in self.viewer_widgets:
             return
 
-        pin_type_old, widget = self.viewer_widgets[pin_name]
+        entry = self.viewer_widgets[pin_name]
+
+        if entry.widget is None:
+            # 标签页尚未构建：只更新待构建的数据
+            placeholder = self._pending[pin_name][2]
+            self._pending[pin_name] = (pin_type, data, placeholder)
+            self.viewer_widgets[pin_name] = _TabEntry(pin_type, None, None)
+            return
 
         # Check if type changed (shouldn't happen, but handle gracefully)
-        if pin_type_old != pin_type:
+        if entry.pin_type != pin_type:
             # Need to recreate the tab
-            index = self.tabWidget.indexOf(widget)
+            index = self._widget_to_index.get(entry.widget, -1)
             if index >= 0:
-                self.tabWidget.removeTab(index)
-                new_widget = self._createTabWidget(pin_name, pin_type, data)
-                self.tabWidget.insertTab(index, new_widget, pin_name)
-                self.viewer_widgets[pin_name] = (pin_type, new_widget)
+                new_entry = self._createTabEntry(pin_name, pin_type, data)
+                self._replaceTab(index, entry.widget, new_entry.widget, pin_name)
+                self.viewer_widgets[pin_name] = new_entry
+                self._recycle(entry)
             return
 
         # Update existing widget
         if pin_type == DATAFRAME_PIN:
-            if hasattr(widget, 'setDataFrame'):
-                widget.setDataFrame(data if data is not None else pd.DataFrame())
+            entry.widget.setDataFrame(data)
         elif pin_type == MPL_FIGURE_PIN:
-            if hasattr(widget, '_plotViewer'):
-                widget._plotViewer.setFigure(data)
+            plotViewer = entry.plot
+            if data is not None and getattr(plotViewer, "current_figure", None) is data:
+                # 同一 Figure 实例：未修改时无需任何操作；已修改（stale）只请求一次延迟重绘，
+                # 不重建画布与工具栏
+                if not getattr(data, "stale", False):
+                    return
+                if plotViewer.canvas is not None:
+                    plotViewer.redraw()
+                    return
+                # 静态视图没有画布：走下方的合并更新重新栅格化
+            self._pendingFigures[pin_name] = (plotViewer, data)
+            self._redrawTimer.start()
+
+    def _flushFigureRedraws(self):
+        """应用合并后的 Figure 更新，每个引脚只取最后一次的数据。"""
+        pending, self._pendingFigures = self._pendingFigures, {}
+        for plotViewer, figure in pending.values():
+            plotViewer.setFigure(figure)
 
     def updateAllPins(self, pins_data_dict):
-        """Update all pins with new data."""
+        """Update all pins with new data (applied at most once per frame)."""
         if not isinstance(pins_data_dict, dict):
             return
+        # 每次传入的是全部引脚的完整状态，后到的直接覆盖先到的
+        self._pendingPins = pins_data_dict
+        if not self._updateTimer.isActive():
+            self._updateTimer.start()
 
-        # Add missing tabs or update existing ones
-        handled = set()
-        for pin_name, (pin_type, data) in pins_data_dict.items():
-            if pin_name not in self.viewer_widgets:
-                widget = self._createTabWidget(pin_name, pin_type, data)
-                self.tabWidget.addTab(widget, pin_name)
-                self.viewer_widgets[pin_name] = (pin_type, widget)
-            self.setPinData(pin_name, pin_type, data)
-            handled.add(pin_name)
+    def _applyPendingUpdates(self):
+        pins_data_dict, self._pendingPins = self._pendingPins, None
+        if pins_data_dict is None:
+            return
+        elapsed = QtCore.QElapsedTimer()
+        elapsed.start()
+        self._doUpdateAllPins(pins_data_dict)
+        self._updateTimer.setInterval(max(16, elapsed.elapsed()))
+
+    def _doUpdateAllPins(self, pins_data_dict):
+        get = pins_data_dict.__getitem__
+        new_keys = pins_data_dict.keys()
+        old_keys = self.viewer_widgets.keys()
+        current = self.tabWidget.currentWidget()
+        with self._batchTabChanges():
+            # Remove tabs for pins that no longer exist
+            for pin_name in old_keys - new_keys:
+                self._removePinTab(pin_name)
+
+            # Update existing tabs；同一对象也交给 setPinData 处理（原地修改的数据、stale 的 Figure）
+            for pin_name in new_keys & old_keys:
+                payload = get(pin_name)
+                pin_type, data = payload
+                entry = self.viewer_widgets[pin_name]
+                if entry.widget is not None and entry.widget is not current:
+                    # 已构建但不可见：只记录（直接保存传入的 (pin_type, data)），切换到该页时再刷新
+                    self._dirty_data[pin_name] = payload
+                    continue
+                self.setPinData(pin_name, pin_type, data)
 
-        # Remove tabs for pins that no longer exist
-        for pin_name in list(self.viewer_widgets.keys()):
-            if pin_name not in handled:
-                _, widget = self.viewer_widgets.pop(pin_name)
-                index = self.tabWidget.indexOf(widget)
-                if index >= 0:
-                    self.tabWidget.removeTab(index)
+            # Add missing tabs (in the order given by pins_data_dict)；只对新增引脚取值
+            for pin_name in new_keys:
+                if pin_name not in self.viewer_widgets:
+                    pin_type, data = get(pin_name)
+                    self._addPlaceholderTab(pin_name, pin_type, data)
 
     def closeEvent(self, event):
-        """关闭时先清理 Figure 相关 viewer，再交由 Mixin 保存几何信息。"""
-        # 主动清理 matplotlib viewer，断开回调，防止关闭后仍触发事件
-        try:
-            for pin_name, (pin_type, widget) in list(self.viewer_widgets.items()):
-                if pin_type == MPL_FIGURE_PIN and hasattr(widget, '_plotViewer'):
-                    try:
-                        widget._plotViewer.clear()
-                    except Exception:
-                        pass
-        except Exception:
-            pass
-        # 交由 Mixin 统一保存 geometry
+        """关闭时先清理 Figure 相关 viewer；几何信息由 Mixin 在 finished 时保存。
+
+        对话框被复用（`releaseOnClose` 为 False）时只隐藏，保留各标签页的内容，
+        持有者销毁前将其恢复为 True 再关闭，由 `releaseViewers` 清理。
+        """
+        if self.releaseOnClose:
+            self.releaseViewers()
+        # QDialog.closeEvent 会触发 reject -> finished，由 Mixin 统一保存 geometry
         super(MixedDataViewerDialog, self).closeEvent(event)
 
+    def releaseViewers(self):
+        """停止待处理的更新，销毁复用池中的 viewer，并断开 Figure viewer 的回调。"""
+        # 丢弃尚未应用的引脚与 Figure 更新
+        self._updateTimer.stop()
+        self._pendingPins = None
+        self._redrawTimer.stop()
+        self._pendingFigures.clear()
+        # 复用池中的 viewer 已无父控件，需显式销毁
+        for pool in self._widget_pool.values():
+            for entry in pool:
+                entry.widget.deleteLater()
+            pool.clear()
+        # 主动清理 matplotlib viewer，断开回调，防止关闭后仍触发事件；
+        # 期间暂停循环垃圾回收，结束后统一回收一次，而不是每个 Figure 各触发一轮
+        plots = [entry.plot for entry in self.viewer_widgets.values() if entry.plot is not None]
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for plot in plots:
+                try:
+                    plot.clear()
+                except Exception:
+                    pass
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        if plots:
+            gc.collect()
+
     # 接受/拒绝的保存逻辑由 Mixin 统一处理，无需重复实现
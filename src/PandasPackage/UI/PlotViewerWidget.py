@@ -5,24 +5,66 @@ Reusable widget for displaying matplotlib Figure objects with interactive featur
 Uses matplotlib's Qt backend for embedding plots in Qt applications.
 """
 
-from qtpy import QtWidgets, QtCore, QtGui
+import base64
+import io
+import pickle
+from contextlib import suppress
+
+from qtpy import QtWidgets, QtCore
+from ._background import BackgroundRunner
+
 try:
-    import matplotlib
-    # Auto-detect Qt version (Qt6/PySide6 uses QtAgg, Qt5 uses Qt5Agg)
-    # qtpy automatically handles Qt5/Qt6 compatibility
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# matplotlib 及其 Qt 后端在首次创建 PlotViewerWidget 时才导入（见 _ensure_matplotlib），
+# 避免导入本模块时就构建字体缓存；None 表示尚未探测
+MATPLOTLIB_AVAILABLE = None
+matplotlib = None
+_MplFigure = None
+FigureCanvas = None
+NavigationToolbar = None
+
+
+def _ensure_matplotlib():
+    """导入 matplotlib 与 Qt 画布/工具栏类并缓存到模块；返回 matplotlib 是否可用。"""
+    global MATPLOTLIB_AVAILABLE, matplotlib, _MplFigure, FigureCanvas, NavigationToolbar
+    if MATPLOTLIB_AVAILABLE is not None:
+        return MATPLOTLIB_AVAILABLE
     try:
-        # Try Qt6 backend first (for PySide6)
-        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-        from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
+        # global 声明下，这里的 import 直接把 matplotlib 绑定到模块级名称
+        import matplotlib
+        from matplotlib.figure import Figure as _MplFigure
+        # Auto-detect Qt version (Qt6/PySide6 uses QtAgg, Qt5 uses Qt5Agg)
+        # qtpy automatically handles Qt5/Qt6 compatibility
+        try:
+            # Try Qt6 backend first (for PySide6)
+            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+            from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
+        except ImportError:
+            # Fallback to Qt5 backend
+            matplotlib.use('Qt5Agg')
+            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+            from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
     except ImportError:
-        # Fallback to Qt5 backend
-        matplotlib.use('Qt5Agg')
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-    from matplotlib.figure import Figure
+        MATPLOTLIB_AVAILABLE = False
+        return False
     MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+    return True
+
+
+def _renderPickledFigure(data, fileName, dpi):
+    """在工作线程中还原 Figure 副本并用 Agg 输出到文件。
+
+    副本与界面上显示的 Figure 互不共享对象，GUI 线程同时重绘原 Figure 也不会冲突。
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = pickle.loads(data)
+    FigureCanvasAgg(figure).print_figure(fileName, dpi=dpi, bbox_inches='tight')
+    return fileName
 
 
 class PlotViewerWidget(QtWidgets.QWidget):
@@ -31,10 +73,10 @@ class PlotViewerWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super(PlotViewerWidget, self).__init__(parent)
         
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_matplotlib():
             self.setupNoMatplotlibUI()
             return
-            
+
         self.current_figure = None
         self.setupUI()
 
@@ -64,17 +106,48 @@ class PlotViewerWidget(QtWidgets.QWidget):
         self.clearButton.clicked.connect(self.clear)
         infoLayout.addWidget(self.clearButton)
 
+        # 高 dpi 保存放到线程池中渲染，避免阻塞界面
+        self._saveRunner = BackgroundRunner(self)
+        self._saveRunner.finished.connect(self._onSaveFinished)
+        self._saveRunner.failed.connect(self._onSaveFailed)
+
         layout.addLayout(infoLayout)
 
         # Matplotlib canvas (will be created when figure is set)
         self.canvas = None
         self.toolbar = None
+        # 每次完整绘制后缓存的各 Axes 背景，供 updateArtist 局部重绘（blit）使用
+        self._backgrounds = {}
+        # 本控件在当前 Figure 上注册的回调 id（draw_event / resize_event）
+        self._figureCids = []
+        # 已冻结的 Figure 布局引擎（tight/constrained），离开本控件时还原
+        self._frozenLayoutEngine = None
+        # 上次写入信息栏的 (id(figure), 宽, 高, Axes 数)
+        self._lastFigureSignature = None
+
+        # 工具栏坐标提示（set_message）合并：鼠标移动期间 30ms 内只写入最后一条
+        self._pendingMessage = None
+        self._toolbarSetMessage = None
+        self._messageTimer = QtCore.QTimer(self)
+        self._messageTimer.setSingleShot(True)
+        self._messageTimer.setInterval(30)
+        self._messageTimer.timeout.connect(self._flushToolbarMessage)
+
+        # 占位标签与画布页放在同一个 QStackedLayout 中，切换时只改当前页，不再删除/重建控件
+        self.stack = QtWidgets.QStackedLayout()
+        layout.addLayout(self.stack)
 
         # Placeholder label
         self.placeholderLabel = QtWidgets.QLabel("No plot to display")
         self.placeholderLabel.setAlignment(QtCore.Qt.AlignCenter)
         self.placeholderLabel.setStyleSheet("color: #999; font-size: 14px;")
-        layout.addWidget(self.placeholderLabel)
+        self.stack.addWidget(self.placeholderLabel)
+
+        # 画布页：工具栏 + 画布，画布在首次 setFigure 时创建
+        self._canvasPage = QtWidgets.QWidget()
+        canvasLayout = QtWidgets.QVBoxLayout(self._canvasPage)
+        canvasLayout.setContentsMargins(0, 0, 0, 0)
+        self.stack.addWidget(self._canvasPage)
 
     def setupNoMatplotlibUI(self):
         """Setup UI when matplotlib is not available."""
@@ -101,58 +174,235 @@ class PlotViewerWidget(QtWidgets.QWidget):
             return
 
         try:
-            import matplotlib.figure
-            if not isinstance(figure, matplotlib.figure.Figure):
+            if not isinstance(figure, _MplFigure):
                 self.infoLabel.setText(f"Invalid figure type: {type(figure).__name__}")
                 return
 
-            # Safely disconnect any existing callbacks and make current toolbar inert
-            self._safe_teardown()
-
-            # Remove old canvas and toolbar if they exist
-            if self.canvas is not None:
-                self.layout().removeWidget(self.canvas)
-                self.canvas.setParent(None)
-                self.canvas.deleteLater()
-                self.canvas = None
-            if self.toolbar is not None:
-                self.layout().removeWidget(self.toolbar)
-                self.toolbar.setParent(None)
-                self.toolbar.deleteLater()
-                self.toolbar = None
-            if self.placeholderLabel is not None:
-                self.layout().removeWidget(self.placeholderLabel)
-                self.placeholderLabel.setParent(None)
-                self.placeholderLabel = None
+            # 信息栏显示 Figure 自身的尺寸，需在适配画布尺寸之前读取
+            width_in, height_in = figure.get_size_inches()
+            num_axes = len(figure.axes)
+            signature = (id(figure), width_in, height_in, num_axes)
+            if self.canvas is not None and self.canvas.figure is figure:
+                # 同一 Figure 再次设置时内容可能已改变，重绘前恢复其布局引擎以重新求解布局
+                self._restoreLayoutEngine()
+                if signature == self._lastFigureSignature:
+                    # 尺寸/Axes 数未变：信息栏无需更新，只请求重绘
+                    self.canvas.draw_idle()
+                    return
+
+            if self.canvas is None:
+                self._createCanvas(figure)
+            elif self.canvas.figure is not figure:
+                self._swapFigure(figure)
+            if not self.canvas.isEnabled():
+                # closeEvent 的 teardown 会禁用画布；控件再次使用时恢复交互
+                self.canvas.setEnabled(True)
+                self.canvas.setMouseTracking(True)
+            self.stack.setCurrentIndex(1)
 
             # Store reference to prevent garbage collection
             self.current_figure = figure
 
-            # Create new canvas with the figure
-            self.canvas = FigureCanvas(figure)
-            
-            # Create navigation toolbar
-            self.toolbar = NavigationToolbar(self.canvas, self)
-
-            # Add to layout
-            layout = self.layout()
-            layout.addWidget(self.toolbar)
-            layout.addWidget(self.canvas)
-
             # Update info
-            num_axes = len(figure.axes)
-            self.infoLabel.setText(
-                f"Figure: {figure.get_size_inches()[0]:.1f}\" × {figure.get_size_inches()[1]:.1f}\" | "
-                f"Axes: {num_axes}"
-            )
+            self.infoLabel.setText(self._infoText(width_in, height_in, num_axes))
+            self._lastFigureSignature = signature
 
-            # Refresh the canvas
-            self.canvas.draw()
-            QtWidgets.QApplication.processEvents()
+            # 请求一次延迟重绘：由事件循环在空闲时合并执行，连续多次 setFigure 只渲染一次
+            self.canvas.draw_idle()
 
         except Exception as e:
             self.infoLabel.setText(f"Error displaying figure: {e}")
 
+    def redraw(self):
+        """当前 Figure 被修改（stale）后请求一次延迟重绘，布局按原布局引擎重新求解。"""
+        if self.canvas is None:
+            return
+        self._restoreLayoutEngine()
+        self.canvas.draw_idle()
+
+    @staticmethod
+    def _infoText(width_in, height_in, num_axes):
+        return f"Figure: {width_in:.1f}\" × {height_in:.1f}\" | Axes: {num_axes}"
+
+    def refreshInfo(self, figure=None):
+        """只更新信息栏文本，不触发任何画布绘制。"""
+        figure = figure if figure is not None else self.current_figure
+        if figure is None:
+            return
+        width_in, height_in = figure.get_size_inches()
+        self.infoLabel.setText(self._infoText(width_in, height_in, len(figure.axes)))
+
+    def updateArtist(self, artist):
+        """局部重绘单个 artist：恢复缓存的 Axes 背景后只绘制该 artist 并 blit。
+
+        artist 需事先 `set_animated(True)`，否则它已包含在缓存的背景中。
+        尚无可用背景（还未完成过完整绘制）时退回 draw_idle。
+        """
+        if self.canvas is None:
+            return
+        ax = artist.axes
+        background = self._backgrounds.get(ax)
+        if background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(background)
+        ax.draw_artist(artist)
+        self.canvas.blit(ax.bbox)
+
+    def _onDraw(self, event):
+        """完整绘制完成后缓存各 Axes 的背景。"""
+        self._backgrounds = {
+            ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self.canvas.figure.axes
+        }
+
+    def _freezeLayoutEngine(self, event=None):
+        """按下鼠标开始 pan/zoom 时冻结布局：tight/constrained 布局已在上次绘制时求解，
+        拖动过程中的每帧重绘无需再次求解。
+
+        用占位引擎（'none'）替换，保留已计算的 Axes 位置；只在交互期间生效，
+        松开鼠标、画布尺寸变化、Figure 被重新设置或离开本控件时还原，
+        调用方之后的 savefig 等仍使用原布局引擎。
+        """
+        if self.canvas is None:
+            return
+        figure = self.canvas.figure
+        if self._frozenLayoutEngine is not None or not hasattr(figure, "get_layout_engine"):
+            return
+        engine = figure.get_layout_engine()
+        if engine is None or type(engine).__name__ == "PlaceHolderLayoutEngine":
+            return
+        figure.set_layout_engine("none")
+        self._frozenLayoutEngine = engine
+
+    def _restoreLayoutEngine(self, event=None):
+        """还原被冻结的布局引擎；下一次绘制会重新求解布局。"""
+        if self._frozenLayoutEngine is None or self.canvas is None:
+            return
+        engine, self._frozenLayoutEngine = self._frozenLayoutEngine, None
+        self.canvas.figure.set_layout_engine(engine)
+
+    def _connectFigureEvents(self):
+        self._figureCids = [
+            self.canvas.mpl_connect('draw_event', self._onDraw),
+            self.canvas.mpl_connect('button_press_event', self._freezeLayoutEngine),
+            self.canvas.mpl_connect('button_release_event', self._restoreLayoutEngine),
+            self.canvas.mpl_connect('resize_event', self._restoreLayoutEngine),
+        ]
+
+    def _disconnectFigureEvents(self):
+        for cid in self._figureCids:
+            self.canvas.mpl_disconnect(cid)
+        self._figureCids = []
+
+    def _createCanvas(self, figure):
+        """首次显示 Figure 时创建画布与工具栏，之后的 setFigure 复用同一画布。"""
+        self._takeFromOtherViewer(figure)
+        self.canvas = FigureCanvas(figure)
+        self._createToolbar()
+
+        layout = self._canvasPage.layout()
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+        self._connectFigureEvents()
+
+    def _swapFigure(self, figure):
+        """把已有画布切换到新的 Figure，只重建工具栏。
+
+        matplotlib >= 3.6 的画布回调注册在 Figure 上，工具栏的 pan/zoom 回调随旧 Figure 留下，
+        因此工具栏需按 Figure 重建；画布本身（Qt 控件与 Agg 缓冲）保持不变。
+        """
+        self._detachCurrentFigure()
+        self._takeFromOtherViewer(figure)
+
+        figure.set_canvas(self.canvas)
+        self.canvas.figure = figure
+        self._fitFigureToCanvas(figure)
+        # draw_event/resize_event 回调同样随 Figure 存放，需要在新 Figure 上重新连接
+        self._connectFigureEvents()
+
+        self._createToolbar()
+        self._canvasPage.layout().insertWidget(0, self.toolbar)
+
+    def _takeFromOtherViewer(self, figure):
+        """Figure 仍挂在另一个 PlotViewerWidget 的画布上时，先让那个 viewer 释放它。
+
+        否则旧画布会继续按自己的绘制与尺寸事件重绘这个 Figure，旧工具栏注册在 Figure 上的
+        回调也会响应本画布的鼠标事件。其他来源的画布（如 pyplot 窗口）不归本控件管理，保持不动。
+        """
+        old = figure.canvas
+        if old is None or old is self.canvas or not isinstance(old, QtWidgets.QWidget):
+            return
+        owner = old.parent()
+        while owner is not None and not isinstance(owner, PlotViewerWidget):
+            owner = owner.parent()
+        if owner is not None and owner.current_figure is figure:
+            owner.clear()
+
+    def _detachCurrentFigure(self):
+        """断开本控件在画布当前 Figure 上的工具栏与事件回调，并还原其布局引擎。"""
+        self._releaseToolbar()
+        self._restoreLayoutEngine()
+        self._disconnectFigureEvents()
+        self._backgrounds = {}
+
+    def _createToolbar(self):
+        """为当前 Figure 创建工具栏。
+
+        不显示坐标标签（coordinates=False）：省去该 QLabel 及其在鼠标移动时的逐次重绘；
+        消息仍经由工具栏的 message 信号发出。
+        """
+        self.toolbar = NavigationToolbar(self.canvas, self, coordinates=False)
+        self._debounceToolbarMessages()
+
+    def _debounceToolbarMessages(self):
+        """替换当前工具栏的 set_message：只记录最新消息，由定时器统一写入。"""
+        self._toolbarSetMessage = self.toolbar.set_message
+
+        def set_message(s):
+            self._pendingMessage = s
+            if not self._messageTimer.isActive():
+                self._messageTimer.start()
+
+        self.toolbar.set_message = set_message
+
+    def _flushToolbarMessage(self):
+        if self._toolbarSetMessage is not None and self._pendingMessage is not None:
+            self._toolbarSetMessage(self._pendingMessage)
+        self._pendingMessage = None
+
+    def _releaseToolbar(self):
+        """断开工具栏在当前 Figure 上的回调并移除工具栏。"""
+        toolbar = self.toolbar
+        if toolbar is None:
+            return
+        for name in ("_id_press", "_id_release", "_id_drag"):
+            cid = getattr(toolbar, name, None)
+            if cid is not None:
+                try:
+                    self.canvas.mpl_disconnect(cid)
+                except Exception:
+                    pass
+        try:
+            toolbar.set_message = lambda *a, **k: None
+        except Exception:
+            pass
+        self._messageTimer.stop()
+        self._pendingMessage = None
+        self._toolbarSetMessage = None
+        self._canvasPage.layout().removeWidget(toolbar)
+        toolbar.setParent(None)
+        toolbar.deleteLater()
+        self.toolbar = None
+
+    def _fitFigureToCanvas(self, figure):
+        """按画布当前尺寸与设备像素比调整新 Figure 的 dpi 与尺寸（与画布 resizeEvent 的计算一致）。"""
+        ratio = getattr(self.canvas, "device_pixel_ratio", 1) or 1
+        figure.set_dpi(getattr(figure, "_original_dpi", figure.dpi) * ratio)
+        width = self.canvas.width() * ratio / figure.dpi
+        height = self.canvas.height() * ratio / figure.dpi
+        if width > 0 and height > 0:
+            figure.set_size_inches(width, height, forward=False)
+
     def getFigure(self):
         """Get the current Figure."""
         return self.current_figure
@@ -170,89 +420,121 @@ class PlotViewerWidget(QtWidgets.QWidget):
             "PNG Files (*.png);;PDF Files (*.pdf);;SVG Files (*.svg);;All Files (*)"
         )
 
-        if fileName:
+        if not fileName:
+            return
+        try:
+            # Figure 显示在本控件的画布上（无 pyplot manager），序列化得到的是独立副本
+            data = pickle.dumps(self.current_figure)
+        except Exception:
+            # 含不可序列化对象（如 lambda 格式化器）的 Figure 退回在 GUI 线程同步保存
             try:
-                self.current_figure.savefig(fileName, dpi=300, bbox_inches='tight')
-                QtWidgets.QMessageBox.information(
-                    self, "Success", f"Plot saved to {fileName}"
-                )
+                self._saveFigure(fileName)
             except Exception as e:
-                QtWidgets.QMessageBox.critical(
-                    self, "Save Error", f"Failed to save plot: {e}"
-                )
+                self._onSaveFailed(str(e))
+            else:
+                self._onSaveFinished(fileName)
+            return
+        self.saveButton.setEnabled(False)
+        self._saveRunner.submit(_renderPickledFigure, data, fileName, 300)
+
+    def _onSaveFinished(self, fileName):
+        self.saveButton.setEnabled(True)
+        QtWidgets.QMessageBox.information(
+            self, "Success", f"Plot saved to {fileName}"
+        )
+
+    def _onSaveFailed(self, message):
+        self.saveButton.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self, "Save Error", f"Failed to save plot: {message}"
+        )
+
+    def _saveFigure(self, target, dpi=300, format=None):
+        """用离屏 Agg 画布保存当前 Figure。
+
+        直接调用 Figure.savefig 会经由界面上的 Qt 画布输出，保存后还会重绘该画布；
+        这里临时挂接 FigureCanvasAgg（PDF/SVG 等格式由其 print_figure 自动切换后端，
+        PNG 直接走 Agg 的 print_png），完成后把 Figure 交还给原画布。
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        figure = self.current_figure
+        original = figure.canvas
+        try:
+            FigureCanvasAgg(figure).print_figure(
+                target, dpi=dpi, format=format, bbox_inches='tight'
+            )
+        finally:
+            figure.set_canvas(original)
+
+    def toPngBytes(self, dpi=100):
+        """返回当前 Figure 的 PNG 字节；没有 Figure 时返回 None。"""
+        if self.current_figure is None:
+            return None
+        buffer = io.BytesIO()
+        self._saveFigure(buffer, dpi=dpi, format='png')
+        return buffer.getvalue()
+
+    def toPngBase64(self, dpi=100):
+        """返回当前 Figure 的 base64 编码 PNG（用于内嵌到 HTML 等）；安装了 pybase64 时使用其 SIMD 编码。"""
+        data = self.toPngBytes(dpi)
+        if data is None:
+            return None
+        if PYBASE64_AVAILABLE:
+            return pybase64.b64encode(data)
+        return base64.b64encode(data)
 
     def clear(self):
         """Clear the viewer."""
         if not MATPLOTLIB_AVAILABLE:
             return
 
-        # Safely disconnect and teardown first to avoid callbacks firing after deletion
-        self._safe_teardown()
-
-        # Remove canvas and toolbar
-        if self.canvas is not None:
-            self.layout().removeWidget(self.canvas)
-            self.canvas.setParent(None)
-            self.canvas.deleteLater()
-            self.canvas = None
-        if self.toolbar is not None:
-            self.layout().removeWidget(self.toolbar)
-            self.toolbar.setParent(None)
-            self.toolbar.deleteLater()
-            self.toolbar = None
-
-        # Restore placeholder
-        if self.placeholderLabel is None:
-            layout = self.layout()
-            self.placeholderLabel = QtWidgets.QLabel("No plot to display")
-            self.placeholderLabel.setAlignment(QtCore.Qt.AlignCenter)
-            self.placeholderLabel.setStyleSheet("color: #999; font-size: 14px;")
-            layout.addWidget(self.placeholderLabel)
+        if self.canvas is not None and self.current_figure is not None:
+            # 画布改为持有一个空白 Figure，释放对调用方 Figure 的引用；画布本身保留复用
+            self._detachCurrentFigure()
+            blank = _MplFigure()
+            blank.set_canvas(self.canvas)
+            self.canvas.figure = blank
+        self.stack.setCurrentIndex(0)
 
         self.current_figure = None
+        self._lastFigureSignature = None
         self.infoLabel.setText("No plot")
 
     def _safe_teardown(self):
         """Disconnect Matplotlib callbacks and make toolbar inert before deletion."""
-        # Stop Qt interactions on the canvas
+        # Stop Qt interactions on the canvas and disconnect all Matplotlib callbacks registered on it
         if getattr(self, "canvas", None) is not None:
-            try:
+            with suppress(Exception):
                 self.canvas.setMouseTracking(False)
                 self.canvas.setEnabled(False)
-            except Exception:
-                pass
-            # Disconnect all Matplotlib callbacks registered on this canvas
-            try:
-                registry = getattr(self.canvas, "callbacks", None)
-                if registry is not None and hasattr(registry, "callbacks"):
+                registry = self.canvas.callbacks
+                func_cid_map = getattr(registry, "_func_cid_map", None)
+                if func_cid_map is not None:
+                    # 一次清空整个注册表；逐个 mpl_disconnect 每次都要遍历注册表，回调多时为 O(N²)
+                    registry.callbacks.clear()
+                    func_cid_map.clear()
+                    getattr(registry, "_pickled_cids", set()).clear()
+                else:
                     for _event, mapping in list(registry.callbacks.items()):
                         for cid in list(mapping.keys()):
-                            try:
-                                self.canvas.mpl_disconnect(cid)
-                            except Exception:
-                                pass
-            except Exception:
-                pass
+                            self.canvas.mpl_disconnect(cid)
 
         # Make toolbar inert to avoid late set_message updates touching deleted QLabel
         if getattr(self, "toolbar", None) is not None:
-            try:
-                self.toolbar.setVisible(False)
-            except Exception:
-                pass
-            try:
+            self._messageTimer.stop()
+            self._pendingMessage = None
+            self._toolbarSetMessage = None
+            with suppress(Exception):
                 self.toolbar.set_message = lambda *a, **k: None
-            except Exception:
-                pass
-            try:
+                self.toolbar.setVisible(False)
                 if hasattr(self.toolbar, "destroy"):
                     self.toolbar.destroy()
-            except Exception:
-                pass
 
     def closeEvent(self, event):
         # Ensure teardown happens if the widget is closed via parent/dialog
         try:
+            self._safe_teardown()
             self.clear()
         except Exception:
             pass
@@ -5,7 +5,7 @@ Based on DataFrameDialog.py design pattern, provides non-modal property editing
 with window state persistence and support for multiple instances.
 """
 
-from qtpy import QtWidgets, QtCore, QtGui
+from qtpy import QtWidgets, QtCore
 from uflow.UI.Widgets.PropertiesFramework import PropertiesWidget
 from ._dialog_persistence import PersistentGeometryDialogMixin
 
@@ -16,8 +16,8 @@ class PropertiesDialog(PersistentGeometryDialogMixin, QtWidgets.QDialog):
     def __init__(self, node=None, parent=None):
         super(PropertiesDialog, self).__init__(parent)
         self.node = node
-        # 保留原 settings，Mixin 会优先使用此实例
-        self.settings = QtCore.QSettings("uflow", "PropertiesDialog")
+        # 同类对话框共享同一 QSettings 实例（按类名缓存），Mixin 会优先使用此实例
+        self.settings = self.sharedSettings()
         self.setupUI()
         # 统一通过 Mixin 恢复几何信息
         self.restoreWindowGeometry()
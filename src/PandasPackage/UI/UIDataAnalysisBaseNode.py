@@ -1,13 +1,47 @@
+import importlib
 import os
-import pandas as pd
+import weakref
+from qtpy.QtCore import Qt, QTimer
 from uflow.UI.Canvas.UINodeBase import UINodeBase
 from uflow.UI.Canvas.NodeActionButton import NodeActionButtonBase
 from uflow.UI.Canvas.UICommon import NodeActionButtonInfo
-from ..UI.DataFrameDialog import DataFrameDialog, MultiDataFrameDialog
-from ..UI.FigureDialog import FigureDialog
-from ..UI.MixedDataViewerDialog import MixedDataViewerDialog
 from ..Pins import DATAFRAME_PIN, MPL_FIGURE_PIN
-from ..UI.PropertiesDialog import PropertiesDialog
+
+# 图标路径在导入时计算一次，不随节点实例重复拼接
+_RES_DIR = os.path.join(os.path.dirname(__file__), "resources")
+_VIEW_ICON_PATH = os.path.join(_RES_DIR, "view.svg")
+_REFRESH_ICON_PATH = os.path.join(_RES_DIR, "reload.svg")
+
+
+# 查看对话框类名 -> 所在模块。对话框模块会牵连导入 pandas / matplotlib，
+# 改为在首次打开对应对话框时才导入，未查看过数据的节点不承担这部分开销
+_DIALOG_MODULES = {
+    "DataFrameDialog": ".DataFrameDialog",
+    "MultiDataFrameDialog": ".DataFrameDialog",
+    "FigureDialog": ".FigureDialog",
+    "MixedDataViewerDialog": ".MixedDataViewerDialog",
+}
+
+
+def _dialogClass(name):
+    """按类名导入并返回查看对话框类。"""
+    return getattr(importlib.import_module(_DIALOG_MODULES[name], __package__), name)
+
+
+def _singlePinArgs(pins_data_dict):
+    """单引脚对话框的构造参数 (data, pin_name)。"""
+    pin_name, (_, data) = next(iter(pins_data_dict.items()))
+    return data, pin_name
+
+
+def _dataFramesArgs(pins_data_dict):
+    """MultiDataFrameDialog 的构造参数 ({pin_name: dataframe},)。"""
+    return ({name: data for name, (_, data) in pins_data_dict.items()},)
+
+
+def _pinsDataArgs(pins_data_dict):
+    """MixedDataViewerDialog 的构造参数 ({pin_name: (pin_type, data)},)。"""
+    return (pins_data_dict,)
 
 
 class ViewDataFrameNodeActionButton(NodeActionButtonBase):
@@ -31,7 +65,8 @@ class PropertiesDialogManager:
     """Global manager for properties dialogs to prevent conflicts."""
 
     _instance = None
-    _active_dialogs = {}
+    # 以节点对象（弱引用）为键：节点被回收后条目自动消失，也不会因 id 复用而串到别的节点
+    _active_dialogs = weakref.WeakKeyDictionary()
     _current_dialog = None  # Track the currently visible dialog
 
     def __new__(cls):
@@ -41,12 +76,22 @@ class PropertiesDialogManager:
 
     def get_or_create_dialog(self, node, parent):
         """Get existing dialog for node or create new one."""
-        node_id = id(node)
-        if node_id not in self._active_dialogs:
+        dialog = self._active_dialogs.get(node)
+        if dialog is None:
+            from .PropertiesDialog import PropertiesDialog
+
             dialog = PropertiesDialog(parent=parent)
-            dialog.finished.connect(lambda: self._on_dialog_closed(node_id))
-            self._active_dialogs[node_id] = dialog
-        return self._active_dialogs[node_id]
+            # 关闭即销毁，避免隐藏的对话框长期持有节点
+            dialog.setAttribute(Qt.WA_DeleteOnClose, True)
+            # 回调只持有节点的弱引用，否则节点会被信号连接一直引用
+            nodeRef = weakref.ref(node)
+            dialog.finished.connect(lambda *args: self._on_dialog_closed(nodeRef()))
+            self._active_dialogs[node] = dialog
+        return dialog
+
+    def dialog_for_node(self, node):
+        """Return the node's dialog, or None if it has none."""
+        return self._active_dialogs.get(node)
 
     def show_dialog_for_node(self, node, parent, setNodeCallback):
         """Show dialog for specific node, hiding any currently visible dialog."""
@@ -66,13 +111,23 @@ class PropertiesDialogManager:
 
         return dialog
 
-    def _on_dialog_closed(self, node_id):
+    def _on_dialog_closed(self, node):
         """Handle dialog being closed."""
-        if node_id in self._active_dialogs:
-            dialog = self._active_dialogs[node_id]
-            if self._current_dialog is dialog:
-                self._current_dialog = None
-            del self._active_dialogs[node_id]
+        if node is None:
+            # 节点已被回收，弱引用字典中的条目已随之移除
+            return
+        dialog = self._active_dialogs.pop(node, None)
+        if dialog is not None and self._current_dialog is dialog:
+            self._current_dialog = None
+
+    def close_all_dialogs_for_node(self, node):
+        """Close and forget the dialog belonging to node."""
+        dialog = self._active_dialogs.pop(node, None)
+        if dialog is None:
+            return
+        if self._current_dialog is dialog:
+            self._current_dialog = None
+        dialog.close()
 
     def close_all_dialogs(self):
         """Close all active property dialogs."""
@@ -94,30 +149,28 @@ class UIDataAnalysisBaseNode(UINodeBase):
         super(UIDataAnalysisBaseNode, self).__init__(raw_node)
 
         # Collect all viewable pins (DataFramePin and MatplotlibFigurePin)
-        self.dataFramePins = []
-        self.figurePins = []
+        self._rebuildPinIndex()
 
-        # Check output pins first
-        for pin in self._rawNode.outputs.values():
-            if pin.dataType == DATAFRAME_PIN:
-                self.dataFramePins.append(pin)
-            elif pin.dataType == MPL_FIGURE_PIN:
-                self.figurePins.append(pin)
+        # 双击命中测试用的矩形（节点名 + 动作按钮），节点外形更新时失效
+        self._buttonRectsCache = None
 
-        # If no output pins, check input pins
-        if not self.dataFramePins and not self.figurePins:
-            for pin in self._rawNode.inputs.values():
-                if pin.dataType == DATAFRAME_PIN:
-                    self.dataFramePins.append(pin)
-                elif pin.dataType == MPL_FIGURE_PIN:
-                    self.figurePins.append(pin)
+        # 本轮计算内各引脚 getData() 的结果 {id(pin): data}；节点每次 computed 时清空
+        self._pinDataCache = {}
 
         # Track dialog state (like OpenCV's displayImage)
         self.viewerDialog = None
         self.isDialogVisible = False
+        # 每种查看对话框各保留一个实例 {dialog_class_name: dialog}；关闭时只隐藏，再次打开时复用
+        self._dialogPool = {}
+        # 上次推送给对话框的数据 {pin_name: (pin_type, data)}；持有引用，数据对象未变时跳过刷新
+        self._lastPushedData = {}
+        # 合并短时间内连续触发的 computed：窗口内只刷新一次对话框
+        self._dialogUpdateTimer = QTimer(self)
+        self._dialogUpdateTimer.setSingleShot(True)
+        self._dialogUpdateTimer.setInterval(self._DIALOG_UPDATE_DELAY_MS)
+        self._dialogUpdateTimer.timeout.connect(self.updateDialogData)
 
         # Track properties dialog state
-        self.propertiesDialog = None
         self.isPropertiesDialogVisible = False
         self.dialogManager = PropertiesDialogManager()
 
@@ -128,29 +181,132 @@ class UIDataAnalysisBaseNode(UINodeBase):
             self.actionViewData.setToolTip("Toggle data viewer dialog")
             self.actionViewData.triggered.connect(self.viewData)
 
-            viewIconPath = os.path.join(
-                os.path.dirname(__file__), "resources", "view.svg"
-            )
-
-            self.actionViewData.setData(
-                NodeActionButtonInfo(viewIconPath, ViewDataFrameNodeActionButton)
-            )
+            self.actionViewData.setData(self._viewButtonInfo())
 
             # Create refresh action and button
             self.actionRefreshData = self._menu.addAction("RefreshNode")
             self.actionRefreshData.setToolTip("Refresh node computation")
             self.actionRefreshData.triggered.connect(self.refreshData)
 
-            refreshIconPath = os.path.join(
-                os.path.dirname(__file__), "resources", "reload.svg"
+            self.actionRefreshData.setData(self._refreshButtonInfo())
+
+        # 先于 onNodeComputed 连接：子类即使重写 onNodeComputed，缓存也会在每次计算后失效
+        self._rawNode.computed.connect(self._invalidatePinDataCache)
+        # Connect to computed signal for auto-update (like OpenCV)
+        self._rawNode.computed.connect(self.onNodeComputed)
+
+    # NodeActionButtonInfo 只描述图标路径与按钮类，所有节点共用同一实例
+    _VIEW_BUTTON_INFO = None
+    _REFRESH_BUTTON_INFO = None
+
+    @staticmethod
+    def _viewButtonInfo():
+        info = UIDataAnalysisBaseNode._VIEW_BUTTON_INFO
+        if info is None:
+            info = UIDataAnalysisBaseNode._VIEW_BUTTON_INFO = NodeActionButtonInfo(
+                _VIEW_ICON_PATH, ViewDataFrameNodeActionButton
+            )
+        return info
+
+    @staticmethod
+    def _refreshButtonInfo():
+        info = UIDataAnalysisBaseNode._REFRESH_BUTTON_INFO
+        if info is None:
+            info = UIDataAnalysisBaseNode._REFRESH_BUTTON_INFO = NodeActionButtonInfo(
+                _REFRESH_ICON_PATH, NodeActionButtonBase
             )
+        return info
+
+    # 所有节点共用的 "No Data" 提示框，首次需要时创建
+    _NO_DATA_BOX = None
+
+    @staticmethod
+    def _noDataBox():
+        box = UIDataAnalysisBaseNode._NO_DATA_BOX
+        if box is None:
+            from qtpy import QtWidgets
 
-            self.actionRefreshData.setData(
-                NodeActionButtonInfo(refreshIconPath, NodeActionButtonBase)
+            box = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Information, "No Data", "No data available to display."
             )
+            # 关闭时只隐藏，下次直接复用
+            box.setAttribute(Qt.WA_DeleteOnClose, False)
+            UIDataAnalysisBaseNode._NO_DATA_BOX = box
+        return box
+
+    # 对话框刷新的合并窗口（毫秒），即最多约 20 次/秒
+    _DIALOG_UPDATE_DELAY_MS = 50
+
+    # (引脚类型掩码, 是否只有一个引脚) -> (对话框类名, 构造参数适配函数)
+    # 掩码 bit0 表示有 DataFrame 引脚，bit1 表示有 Figure 引脚
+    _DIALOG_DISPATCH = {
+        (1, True): ("DataFrameDialog", _singlePinArgs),
+        (1, False): ("MultiDataFrameDialog", _dataFramesArgs),
+        (2, True): ("FigureDialog", _singlePinArgs),
+        (2, False): ("MixedDataViewerDialog", _pinsDataArgs),
+        (3, False): ("MixedDataViewerDialog", _pinsDataArgs),
+    }
+
+    def _rebuildPinIndex(self):
+        """收集可查看的引脚：优先输出引脚，没有时退回输入引脚。
+
+        按类型保存引脚列表 `_pinsByType` 与等长的引脚名列表 `_pinNames`，
+        刷新时直接 zip 遍历，不再逐个比较 dataType。
+        `dataFramePins` / `figurePins` 是对应列表的别名。
+        """
+        pinsByType = {DATAFRAME_PIN: [], MPL_FIGURE_PIN: []}
+        for pins in (self._rawNode.outputs.values(), self._rawNode.inputs.values()):
+            for pin in pins:
+                bucket = pinsByType.get(pin.dataType)
+                if bucket is not None:
+                    bucket.append(pin)
+            # If no output pins, check input pins
+            if pinsByType[DATAFRAME_PIN] or pinsByType[MPL_FIGURE_PIN]:
+                break
+        self._pinsByType = pinsByType
+        self._pinNames = {
+            pinType: [pin.name for pin in pins] for pinType, pins in pinsByType.items()
+        }
+        self.dataFramePins = pinsByType[DATAFRAME_PIN]
+        self.figurePins = pinsByType[MPL_FIGURE_PIN]
+
+    def _collectPinData(self):
+        """读取全部可查看引脚的数据，返回 {pin_name: (pin_type, data)}。"""
+        pins_data_dict = {}
+        getData = self._getPinData
+        for pinType in (DATAFRAME_PIN, MPL_FIGURE_PIN):
+            for name, pin in zip(self._pinNames[pinType], self._pinsByType[pinType]):
+                pins_data_dict[name] = (pinType, getData(pin))
+        return pins_data_dict
 
-        # Connect to computed signal for auto-update (like OpenCV)
-        self._rawNode.computed.connect(self.onNodeComputed)
+    def _dataUnchanged(self, pins_data_dict):
+        """各引脚的数据是否都与上次推送的为同一对象（`is` 比较）。
+
+        上次推送的对象由 `_lastPushedData` 持有引用，不会被回收后复用 id；
+        被修改过（stale）的 Figure 即使是同一对象也需要重绘，从不视为未变。
+        """
+        last = self._lastPushedData
+        if pins_data_dict.keys() != last.keys():
+            return False
+        for name, (pinType, data) in pins_data_dict.items():
+            lastType, lastData = last[name]
+            if data is not lastData or pinType != lastType:
+                return False
+            if pinType == MPL_FIGURE_PIN and getattr(data, "stale", False):
+                return False
+        return True
+
+    def _invalidatePinDataCache(self, *args, **kwargs):
+        self._pinDataCache.clear()
+
+    def _getPinData(self, pin):
+        """返回引脚数据；同一轮计算内重复读取时直接复用上次 getData() 的结果。"""
+        key = id(pin)
+        try:
+            return self._pinDataCache[key]
+        except KeyError:
+            data = self._pinDataCache[key] = pin.getData()
+            return data
 
     def viewData(self):
         """Toggle data viewer dialog (like OpenCV's viewImage)."""
@@ -161,105 +317,84 @@ class UIDataAnalysisBaseNode(UINodeBase):
         self.isDialogVisible = not self.isDialogVisible
 
         if self.isDialogVisible:
+            # 只在首次打开或引脚数据已过期时重新计算；关闭对话框无需触发上游计算
+            needsRefresh = not self._lastPushedData or any(
+                getattr(pin, "dirty", True) for pin in self.dataFramePins + self.figurePins
+            )
             # Open/show dialog
             self.showViewerDialog()
+            if needsRefresh:
+                # Refresh data when opening (like OpenCV's refreshImage)
+                self.refreshData()
         else:
             # Close dialog
             self.closeViewerDialog()
-        
-        # Force refresh data when toggling (like OpenCV's refreshImage)
-        self.refreshData()
 
     def showViewerDialog(self):
         """Show the appropriate viewer dialog based on available pin types."""
-        from qtpy import QtWidgets
-
-        # Collect data from all pins
-        dataframes_dict = {}
-        figures_dict = {}
-        pins_data_dict = {}
-
-        for pin in self.dataFramePins:
-            df = pin.getData()
-            dataframes_dict[pin.name] = df
-            pins_data_dict[pin.name] = (DATAFRAME_PIN, df)
-
-        for pin in self.figurePins:
-            fig = pin.getData()
-            figures_dict[pin.name] = fig
-            pins_data_dict[pin.name] = (MPL_FIGURE_PIN, fig)
+        mask = (1 if self.dataFramePins else 0) | (2 if self.figurePins else 0)
+        if not mask:
+            # No pins at all - this shouldn't happen if we got here, but handle gracefully
+            box = self._noDataBox()
+            box.show()
+            box.raise_()
+            self.isDialogVisible = False
+            return
 
-        # Only show warning if we have pins but no data
-        # If there are no pins at all, don't show warning (node doesn't support preview)
-        has_any_pins = len(self.dataFramePins) > 0 or len(self.figurePins) > 0
-        
-        if not pins_data_dict:
-            if has_any_pins:
-                # We have pins but no data - node may not have executed yet
-                # Still show dialog but with empty/placeholder content
-                # This allows user to see the dialog and wait for data
-                pass
-            else:
-                # No pins at all - this shouldn't happen if we got here, but handle gracefully
-                QtWidgets.QMessageBox.information(
-                    None, "No Data", "No data available to display."
-                )
-                self.isDialogVisible = False
-                return
+        # Collect data from all pins; pins without data yet show placeholders in the dialog
+        pins_data_dict = self._collectPinData()
 
         # Determine which dialog to use based on pin types
-        has_dataframes = len(self.dataFramePins) > 0
-        has_figures = len(self.figurePins) > 0
-        total_pins = len(self.dataFramePins) + len(self.figurePins)
-        
-        # If no data but we have pins, create empty dialog with placeholder
-        if not pins_data_dict and has_any_pins:
-            # Create a mixed dialog with empty data to show placeholder
-            empty_pins_dict = {}
-            # Add placeholder entries for pins without data
-            for pin in self.dataFramePins:
-                empty_pins_dict[pin.name] = (DATAFRAME_PIN, pd.DataFrame())
-            for pin in self.figurePins:
-                empty_pins_dict[pin.name] = (MPL_FIGURE_PIN, None)
-            self.viewerDialog = MixedDataViewerDialog(empty_pins_dict, parent=None)
-        elif has_dataframes and has_figures:
-            # Mixed types - use MixedDataViewerDialog
-            self.viewerDialog = MixedDataViewerDialog(pins_data_dict, parent=None)
-        elif has_figures and not has_dataframes:
-            # Only figures
-            if total_pins == 1:
-                # Single figure - use simple dialog
-                pin_name, (_, figure) = list(pins_data_dict.items())[0]
-                self.viewerDialog = FigureDialog(figure, pin_name, parent=None)
-            else:
-                # Multiple figures - use mixed dialog
-                self.viewerDialog = MixedDataViewerDialog(pins_data_dict, parent=None)
-        elif has_dataframes and not has_figures:
-            # Only dataframes - use existing DataFrame dialogs
-            if total_pins == 1:
-                # Single DataFrame - use simple dialog
-                pin_name, dataframe = list(dataframes_dict.items())[0]
-                self.viewerDialog = DataFrameDialog(dataframe, pin_name, parent=None)
-            else:
-                # Multiple DataFrames - use tabbed dialog
-                self.viewerDialog = MultiDataFrameDialog(dataframes_dict, parent=None)
+        dialogName, makeArgs = self._DIALOG_DISPATCH[
+            mask, len(self.dataFramePins) + len(self.figurePins) == 1
+        ]
+        args = makeArgs(pins_data_dict)
+
+        # 引脚类型变化时换用另一种对话框，先隐藏当前的
+        if self.viewerDialog is not None and type(self.viewerDialog).__name__ != dialogName:
+            self.viewerDialog.hide()
+
+        dialog = self._dialogPool.get(dialogName)
+        if dialog is None:
+            dialog = _dialogClass(dialogName)(*args, parent=None)
+            # Connect dialog close to update state
+            dialog.finished.connect(self.onDialogClosed)
+            if hasattr(dialog, "releaseOnClose"):
+                # 池中的对话框关闭（含窗口关闭按钮）时只隐藏，清理推迟到 _releaseDialogPool
+                dialog.releaseOnClose = False
+            self._dialogPool[dialogName] = dialog
+            self.viewerDialog = dialog
+            self._lastPushedData = dict(pins_data_dict)
         else:
-            # Should not reach here if we handled empty case above
-            # But handle gracefully just in case
-            pass
-
-        # Connect dialog close to update state
-        self.viewerDialog.finished.connect(self.onDialogClosed)
+            # 复用已有对话框，只推送最新数据
+            self.viewerDialog = dialog
+            if dialogName in ("DataFrameDialog", "FigureDialog"):
+                dialog.setPinName(args[1])
+            self._pushDialogData(pins_data_dict)
 
         # Show as non-modal (allows interaction with graph while open)
-        self.viewerDialog.show()
+        dialog.show()
 
     def closeViewerDialog(self):
         """Close the viewer dialog."""
+        self._dialogUpdateTimer.stop()
         if self.viewerDialog:
-            self.viewerDialog.close()
+            # reject() 只隐藏对话框并发出 finished（保存几何信息），实例留在池中供下次复用
+            self.viewerDialog.reject()
             self.viewerDialog = None
 
+    def _releaseDialogPool(self):
+        """销毁池中保留的全部查看对话框。"""
+        self._dialogUpdateTimer.stop()
+        for dialog in self._dialogPool.values():
+            if hasattr(dialog, "releaseOnClose"):
+                dialog.releaseOnClose = True
+            dialog.close()
+            dialog.deleteLater()
+        self._dialogPool.clear()
+        self.viewerDialog = None
+        self._lastPushedData = {}
+
     def onDialogClosed(self):
         """Handle dialog being closed by user."""
         self.isDialogVisible = False
@@ -271,37 +406,29 @@ class UIDataAnalysisBaseNode(UINodeBase):
             return
 
         # Collect fresh data
-        dataframes_dict = {}
-        figures_dict = {}
-        pins_data_dict = {}
-
-        for pin in self.dataFramePins:
-            df = pin.getData()
-            dataframes_dict[pin.name] = df
-            pins_data_dict[pin.name] = (DATAFRAME_PIN, df)
-
-        for pin in self.figurePins:
-            fig = pin.getData()
-            figures_dict[pin.name] = fig
-            pins_data_dict[pin.name] = (MPL_FIGURE_PIN, fig)
+        pins_data_dict = self._collectPinData()
+        # 引脚数据对象未变（如仅下游节点触发了 computed）时无需重置模型或重绘
+        if self._dataUnchanged(pins_data_dict):
+            return
+        self._pushDialogData(pins_data_dict)
 
-        # Update dialog based on type
-        if isinstance(self.viewerDialog, DataFrameDialog):
+    def _pushDialogData(self, pins_data_dict):
+        """把数据推送给当前对话框。"""
+        self._lastPushedData = dict(pins_data_dict)
+        if not pins_data_dict:
+            return
+        # Update dialog based on type（按类名判断，无需为 isinstance 导入对话框模块）
+        kind = type(self.viewerDialog).__name__
+        if kind == "DataFrameDialog":
             # Single DataFrame dialog
-            if dataframes_dict:
-                pin_name, dataframe = next(iter(dataframes_dict.items()))
-                self.viewerDialog.setDataFrame(dataframe)
-        elif isinstance(self.viewerDialog, FigureDialog):
+            self.viewerDialog.setDataFrame(_singlePinArgs(pins_data_dict)[0])
+        elif kind == "FigureDialog":
             # Single Figure dialog
-            if figures_dict:
-                pin_name, figure = next(iter(figures_dict.items()))
-                self.viewerDialog.setFigure(figure)
-        elif isinstance(self.viewerDialog, MultiDataFrameDialog):
-            # Multi DataFrame dialog - need to recreate (simpler than updating tabs)
-            # Close current and open new one
-            self.closeViewerDialog()
-            self.showViewerDialog()
-        elif isinstance(self.viewerDialog, MixedDataViewerDialog):
+            self.viewerDialog.setFigure(_singlePinArgs(pins_data_dict)[0])
+        elif kind == "MultiDataFrameDialog":
+            # Multi DataFrame dialog - update existing tabs in place
+            self.viewerDialog.updateDataFrames(*_dataFramesArgs(pins_data_dict))
+        elif kind == "MixedDataViewerDialog":
             # Mixed dialog - update all pins
             self.viewerDialog.updateAllPins(pins_data_dict)
 
@@ -313,10 +440,16 @@ class UIDataAnalysisBaseNode(UINodeBase):
     def onNodeComputed(self, *args, **kwargs):
         """Called automatically when node finishes computing (like OpenCV's updateImage).
 
-        Auto-updates the viewer dialog if it's open.
+        Auto-updates the viewer dialog if it's open. Bursts of computed signals
+        are coalesced into a single update.
         """
-        if self.isDialogVisible:
-            self.updateDialogData()
+        if self.isDialogVisible and not self._dialogUpdateTimer.isActive():
+            self._dialogUpdateTimer.start()
+
+    @property
+    def propertiesDialog(self):
+        """本节点的属性对话框；由全局管理器持有，关闭后即为 None。"""
+        return self.dialogManager.dialog_for_node(self)
 
     def togglePropertiesDialog(self):
         """Toggle properties dialog visibility."""
@@ -335,7 +468,7 @@ class UIDataAnalysisBaseNode(UINodeBase):
     def showPropertiesDialog(self):
         """Show the properties dialog."""
         # Use global manager to show dialog and hide any currently visible one
-        self.propertiesDialog = self.dialogManager.show_dialog_for_node(
+        self.dialogManager.show_dialog_for_node(
             self, self.canvasRef(), self.createPropertiesWidget
         )
         self.isPropertiesDialogVisible = True
@@ -349,20 +482,30 @@ class UIDataAnalysisBaseNode(UINodeBase):
     def onPropertiesDialogClosed(self):
         """Handle properties dialog being closed by user."""
         self.isPropertiesDialogVisible = False
-        # Don't set self.propertiesDialog = None here as it's managed by the global manager
+        # propertiesDialog is looked up from the global manager, nothing to reset here
+
+    def updateNodeShape(self):
+        super(UIDataAnalysisBaseNode, self).updateNodeShape()
+        # 按钮与节点名的位置可能已变化
+        self._buttonRectsCache = None
+
+    def _buttonRects(self):
+        """节点名与各动作按钮的几何矩形，惰性构建并缓存。"""
+        rects = self._buttonRectsCache
+        if rects is None:
+            rects = [self.nodeNameWidget.geometry()]
+            rects.extend(button.geometry() for button in self._actionButtons)
+            self._buttonRectsCache = rects
+        return rects
 
     def mouseDoubleClickEvent(self, event):
         """Handle double click on node to toggle properties dialog."""
         # Check if the click is on the node name widget (which handles its own double-click for editing)
-        if self.nodeNameWidget.geometry().contains(event.pos()):
-            # Let the node name widget handle the double-click for text editing
-            super(UIDataAnalysisBaseNode, self).mouseDoubleClickEvent(event)
-            return
-
-        # Check if the click is on any action buttons
-        for button in self._actionButtons:
-            if button.geometry().contains(event.pos()):
-                # Let the action button handle the double-click
+        # or on any action buttons
+        pos = event.pos()
+        for rect in self._buttonRects():
+            if rect.contains(pos):
+                # Let the node name widget / action button handle the double-click
                 super(UIDataAnalysisBaseNode, self).mouseDoubleClickEvent(event)
                 return
 
@@ -373,8 +516,8 @@ class UIDataAnalysisBaseNode(UINodeBase):
 
     def kill(self, *args, **kwargs):
         """Override kill method to clean up dialogs."""
-        # Close properties dialog if open
-        if self.propertiesDialog:
-            self.propertiesDialog.close()
+        # Close properties dialog and drop the manager's reference to this node
+        self.dialogManager.close_all_dialogs_for_node(self)
+        self._releaseDialogPool()
         # Call parent kill method
         super(UIDataAnalysisBaseNode, self).kill(*args, **kwargs)
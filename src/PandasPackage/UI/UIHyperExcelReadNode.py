@@ -21,11 +21,9 @@ class UIHyperExcelReadNode(UIDataAnalysisBaseNode):
         self.updateNodeShape()
         self.updateNodeHeaderColor()
         
-        # Update data frame pins list for viewer functionality
-        self.dataFramePins = []
-        for pin in self._rawNode.outputs.values():
-            if pin.dataType == "DataFramePin":
-                self.dataFramePins.append(pin)
+        # Update viewable pins index for viewer functionality
+        self._invalidatePinDataCache()
+        self._rebuildPinIndex()
 
     def postCreate(self, jsonTemplate=None):
         """Handle post-creation setup, including dynamic pins."""
@@ -0,0 +1,69 @@
+"""
+后台任务执行器。
+
+目的：
+- 把耗时计算（统计、内存估算等）放到全局线程池执行，避免阻塞 GUI 线程。
+- 结果经排队信号送回 GUI 线程；每次提交递增代数，过期任务的结果直接丢弃。
+"""
+
+from qtpy import QtCore
+
+
+class _Task(QtCore.QRunnable):
+    """在线程池中执行 `fn(*args)`，完成后通过执行器的内部信号回传结果。"""
+
+    def __init__(self, runner, generation, fn, args):
+        super(_Task, self).__init__()
+        self._runner = runner
+        self._generation = generation
+        self._fn = fn
+        self._args = args
+
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            payload = (False, e)
+        else:
+            payload = (True, result)
+        try:
+            self._runner._taskDone.emit(self._generation, payload)
+        except RuntimeError:
+            # 执行器（及其所属窗口）已被销毁，结果无人接收
+            pass
+
+
+class BackgroundRunner(QtCore.QObject):
+    """在 QThreadPool 中执行函数，并只把最新一次提交的结果发回 GUI 线程。
+
+    执行器位于 GUI 线程，工作线程发出的内部信号会以排队方式投递，
+    代数检查因此总在 GUI 线程中进行，无需加锁。
+    """
+
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+    _taskDone = QtCore.Signal(int, object)
+
+    def __init__(self, parent=None):
+        super(BackgroundRunner, self).__init__(parent)
+        self._generation = 0
+        self._taskDone.connect(self._onTaskDone)
+
+    def submit(self, fn, *args):
+        """提交任务；之前尚未完成的任务结果将被丢弃。"""
+        self._generation += 1
+        QtCore.QThreadPool.globalInstance().start(_Task(self, self._generation, fn, args))
+
+    def cancel(self):
+        """丢弃所有进行中任务的结果（任务本身仍会执行完毕）。"""
+        self._generation += 1
+
+    def _onTaskDone(self, generation, payload):
+        if generation != self._generation:
+            return
+        ok, value = payload
+        if ok:
+            self.finished.emit(value)
+        else:
+            self.failed.emit(str(value))
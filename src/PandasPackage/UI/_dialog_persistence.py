@@ -1,5 +1,55 @@
 from qtpy import QtWidgets, QtCore
 
+# 按类名缓存的 QSettings；同类对话框的多个实例共享，避免重复打开/解析存储文件
+_SETTINGS_CACHE = {}
+
+# 尚未写入 QSettings 的几何信息 {QSettings: QByteArray}；会话期间只保存在内存中，
+# 退出时一次性写入并 sync（Windows 上每次写入都要访问注册表）
+_PENDING_GEOMETRIES = {}
+# 是否已把 _flushPendingSync 连接到 QApplication.aboutToQuit
+_QUIT_HOOKED = False
+
+# 主屏幕可用区域的缓存；屏幕增减、主屏切换或可用区域变化时失效
+_SCREEN_GEOMETRY = None
+_SCREEN_HOOKED = False
+# 已连接 availableGeometryChanged 的屏幕，避免重复连接
+_WATCHED_SCREEN = None
+
+
+def _invalidateScreenGeometry(*args):
+    global _SCREEN_GEOMETRY
+    _SCREEN_GEOMETRY = None
+
+
+def _primaryScreenGeometry():
+    """返回主屏幕的可用区域（QRect），无屏幕时返回 None。"""
+    global _SCREEN_GEOMETRY, _SCREEN_HOOKED, _WATCHED_SCREEN
+    if _SCREEN_GEOMETRY is None:
+        screen = QtWidgets.QApplication.primaryScreen()
+        if screen is None:
+            return None
+        _SCREEN_GEOMETRY = screen.availableGeometry()
+        if not _SCREEN_HOOKED:
+            app = QtWidgets.QApplication.instance()
+            app.screenAdded.connect(_invalidateScreenGeometry)
+            app.screenRemoved.connect(_invalidateScreenGeometry)
+            app.primaryScreenChanged.connect(_invalidateScreenGeometry)
+            _SCREEN_HOOKED = True
+        if screen is not _WATCHED_SCREEN:
+            # 主屏幕的可用区域也会变化（任务栏移动、分辨率/DPI 变化）
+            screen.availableGeometryChanged.connect(_invalidateScreenGeometry)
+            _WATCHED_SCREEN = screen
+    return _SCREEN_GEOMETRY
+
+
+def _flushPendingSync():
+    """把内存中的几何信息写入各自的 QSettings 并写回存储（每个实例一次）。"""
+    pending = list(_PENDING_GEOMETRIES.items())
+    _PENDING_GEOMETRIES.clear()
+    for settings, geometry in pending:
+        settings.setValue("geometry", geometry)
+        settings.sync()
+
 
 class PersistentGeometryDialogMixin:
     """
@@ -9,53 +59,87 @@ class PersistentGeometryDialogMixin:
     - 统一管理窗口位置与大小的保存/恢复逻辑，消除各个对话框中重复代码。
     - 尽量与现有行为兼容：如果子类已有 `self.settings`（QSettings 实例），优先使用；
       否则按类名构造默认 QSettings("uflow", <ClassName>)。
-    - 提供通用的 `restoreWindowGeometry`、`centerOnScreen`，并在 `closeEvent/accept/reject`
-      中统一保存 geometry。
+    - 提供通用的 `restoreWindowGeometry`、`centerOnScreen`，并在对话框 `finished` 时统一保存 geometry。
+
+    说明：`close()` 会经由 `QDialog.closeEvent` 调用 `reject()`，若在 `closeEvent/accept/reject`
+    中各写一次，一次关闭会写入两到三次 QSettings。`finished` 在每次对话框结束时恰好发出一次，
+    因此只在此处保存。
     """
 
+    def __init__(self, *args, **kwargs):
+        super(PersistentGeometryDialogMixin, self).__init__(*args, **kwargs)
+        # 使用绑定方法而非 lambda，避免连接持有 self 造成循环引用
+        self.finished.connect(self._onFinishedSaveGeometry)
+
+    @classmethod
+    def sharedSettings(cls) -> QtCore.QSettings:
+        """返回按类名共享的 QSettings("uflow", <ClassName>) 实例。"""
+        settings = _SETTINGS_CACHE.get(cls.__name__)
+        if settings is None:
+            settings = QtCore.QSettings("uflow", cls.__name__)
+            _SETTINGS_CACHE[cls.__name__] = settings
+        return settings
+
     def _settings(self) -> QtCore.QSettings:
         """获取用于持久化的 QSettings。
-        优先返回子类设置的 `self.settings`；否则按类名构造默认实例。
+        优先返回子类设置的 `self.settings`；否则使用按类名共享的实例。结果缓存在实例上。
         """
-        if hasattr(self, "settings") and isinstance(self.settings, QtCore.QSettings):
-            return self.settings
-        # 兼容：默认按类名分组，避免相互覆盖
-        return QtCore.QSettings("uflow", type(self).__name__)
+        settings = self.__dict__.get("_cached_settings")
+        if settings is None:
+            settings = getattr(self, "settings", None)
+            if not isinstance(settings, QtCore.QSettings):
+                # 兼容：默认按类名分组，避免相互覆盖
+                settings = self.sharedSettings()
+            self._cached_settings = settings
+        return settings
 
     def restoreWindowGeometry(self):
         """恢复窗口位置与大小；若无历史记录，则居中显示。"""
-        geometry = self._settings().value("geometry")
+        settings = self._settings()
+        # 本次会话中已关闭过的对话框，其几何信息尚在内存中
+        geometry = _PENDING_GEOMETRIES.get(settings)
+        if geometry is None:
+            geometry = settings.value("geometry")
         if geometry:
             self.restoreGeometry(geometry)
+            # 记录已持久化的值；窗口未移动/缩放时关闭无需再写
+            self._lastSavedGeometry = bytes(geometry)
         else:
             self.centerOnScreen()
 
     def centerOnScreen(self):
         """将窗口移动到屏幕中心（仅在首次显示时使用）。"""
-        screen = QtWidgets.QApplication.primaryScreen()
-        if screen:
-            screenGeometry = screen.availableGeometry()
+        screenGeometry = _primaryScreenGeometry()
+        if screenGeometry is not None:
             x = (screenGeometry.width() - self.width()) // 2
             y = (screenGeometry.height() - self.height()) // 2
             self.move(x, y)
 
     def _saveGeometry_(self):
-        """统一保存窗口几何信息。"""
-        self._settings().setValue("geometry", self.saveGeometry())
+        """统一保存窗口几何信息。
 
-    def closeEvent(self, event):
-        """在关闭时保存geometry，并调用父类逻辑。"""
-        self._saveGeometry_()
-        super(PersistentGeometryDialogMixin, self).closeEvent(event)
+        几何信息只记录在内存中，应用退出时统一写入 QSettings 并 sync；
+        与上次保存的相同时直接跳过。
+        """
+        global _QUIT_HOOKED
+        geometry = self.saveGeometry()
+        data = bytes(geometry)
+        if data == self.__dict__.get("_lastSavedGeometry"):
+            return
+        self._lastSavedGeometry = data
 
-    def accept(self):
-        """在接受时保存geometry，并调用父类逻辑。"""
-        self._saveGeometry_()
-        super(PersistentGeometryDialogMixin, self).accept()
+        settings = self._settings()
+        if not _QUIT_HOOKED:
+            app = QtWidgets.QApplication.instance()
+            if app is None:
+                # 没有应用实例就无法在退出时写回，直接写入
+                settings.setValue("geometry", geometry)
+                settings.sync()
+                return
+            app.aboutToQuit.connect(_flushPendingSync)
+            _QUIT_HOOKED = True
+        _PENDING_GEOMETRIES[settings] = geometry
 
-    def reject(self):
-        """在拒绝时保存geometry，并调用父类逻辑。"""
+    def _onFinishedSaveGeometry(self, result):
+        """对话框结束（accept/reject/close）时保存一次 geometry。"""
         self._saveGeometry_()
-        super(PersistentGeometryDialogMixin, self).reject()
-
-
@@ -0,0 +1,125 @@
+"""
+DataFrame 统计摘要（`describe(include="all")` 的加速版本）。
+
+目的：
+- 数值列一次性转换为二维 float64 数组；安装了 numba 时由一个按列并行（prange）、
+  释放 GIL 的内核一次算出全部统计量，否则每个统计量调用一次 numpy nan 系列函数。
+- 非数值列（以及 timedelta、复数列）仍交给 pandas `describe`，输出格式与原先保持一致。
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+_QUANTILES = (0.25, 0.5, 0.75)
+_STAT_ROWS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+if NUMBA_AVAILABLE:
+
+    # 不使用 fastmath：它假定不存在 NaN，会破坏缺失值的处理
+    @numba.njit(cache=True, parallel=True, nogil=True)
+    def _describe_kernel(values, quantiles):
+        """按列并行计算 count/mean/std/min/分位数/max，返回 (8, 列数) 数组。"""
+        n_cols = values.shape[1]
+        out = np.full((8, n_cols), np.nan)
+        for j in numba.prange(n_cols):
+            column = values[:, j]
+            ordered = np.sort(column[~np.isnan(column)])
+            n = ordered.shape[0]
+            out[0, j] = n
+            if n == 0:
+                continue
+            mean = ordered.sum() / n
+            out[1, j] = mean
+            if n > 1:
+                acc = 0.0
+                for v in ordered:
+                    acc += (v - mean) * (v - mean)
+                out[2, j] = np.sqrt(acc / (n - 1))
+            out[3, j] = ordered[0]
+            # 与 numpy/pandas 默认一致的线性插值分位数
+            for k in range(quantiles.shape[0]):
+                pos = quantiles[k] * (n - 1)
+                lo = int(np.floor(pos))
+                hi = min(lo + 1, n - 1)
+                out[4 + k, j] = ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+            out[7, j] = ordered[n - 1]
+        return out
+
+
+def _numpy_stats(values):
+    with warnings.catch_warnings():
+        # 全 NaN 列会触发 RuntimeWarning，结果为 NaN 即可
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return (
+            np.nanmean(values, axis=0),
+            np.nanstd(values, axis=0, ddof=1),
+            np.nanmin(values, axis=0),
+            np.nanquantile(values, _QUANTILES, axis=0),
+            np.nanmax(values, axis=0),
+        )
+
+
+def _numeric_describe(numeric):
+    """对所有数值列计算 count/mean/std/min/四分位数/max。"""
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    if NUMBA_AVAILABLE:
+        # 按列连续存储，内核逐列扫描时访问连续内存
+        table = _describe_kernel(np.asfortranarray(values), np.array(_QUANTILES))
+    else:
+        mean, std, vmin, quantiles, vmax = _numpy_stats(values)
+        rows = [np.count_nonzero(~np.isnan(values), axis=0), mean, std, vmin]
+        rows.extend(np.asarray(quantiles))
+        rows.append(vmax)
+        table = np.vstack(rows)
+    return pd.DataFrame(table, index=_STAT_ROWS, columns=numeric.columns)
+
+
+def _uses_kernel(dtype):
+    """该 dtype 的列是否由数值内核统计。
+
+    timedelta 列在 pandas 中同样按数值统计，但结果以 Timedelta 显示；
+    复数列无法转换为 float64。二者都交给 pandas。
+    """
+    return (
+        pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+        and not pd.api.types.is_timedelta64_dtype(dtype)
+        and not pd.api.types.is_complex_dtype(dtype)
+    )
+
+
+def describe_frame(dataframe):
+    """返回与 `describe(include="all")` 等价的统计表。"""
+    mask = np.fromiter((_uses_kernel(dtype) for dtype in dataframe.dtypes), dtype=bool,
+                       count=dataframe.shape[1])
+    if not mask.any():
+        return dataframe.describe(include="all")
+
+    numeric_stats = _numeric_describe(dataframe.iloc[:, mask])
+    if mask.all():
+        return numeric_stats
+    others_stats = dataframe.iloc[:, ~mask].describe(include="all")
+    result = pd.concat([numeric_stats, others_stats], axis=1)
+    # pandas 按各列统计行数从少到多合并行名；数值列的 8 行不少于任何其他列，
+    # 因此顺序为其余列的行名在前，再补上数值列特有的行（例如有日期列时 std 在最后）
+    rows = list(others_stats.index)
+    rows.extend(r for r in _STAT_ROWS if r not in rows)
+    result = result.reindex(rows)
+    # 恢复原始列顺序（重复列名时无法按标签重排，保持数值列在前）
+    if dataframe.columns.is_unique:
+        result = result[dataframe.columns]
+    return result
+
+
+def describe_text(dataframe):
+    """统计摘要的文本形式，供统计面板显示。"""
+    return describe_frame(dataframe).to_string()
@@ -6,88 +6,560 @@
 """
 
 from qtpy import QtCore
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def _copy_on_write_enabled():
+    """pandas 3 起 Copy-on-Write 总是开启；pandas 2.x 需用户显式启用。"""
+    if int(pd.__version__.split(".", 1)[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except Exception:
+        return False
+
+
+def snapshot(dataframe):
+    """返回视图持有的 DataFrame 快照。
+
+    Copy-on-Write 开启时上游修改不会影响已持有的对象，直接共享即可，
+    省去整表深拷贝；否则退回防御性拷贝。
+    """
+    if _copy_on_write_enabled():
+        return dataframe
+    return dataframe.copy()
+
+
+def memory_usage_mb(dataframe, deep=False):
+    """DataFrame 占用的内存（MB）。deep=True 会逐个统计 Python 对象，较慢。"""
+    return dataframe.memory_usage(index=True, deep=deep).sum() / 1024 / 1024
+
+
+def has_object_columns(dataframe):
+    """是否存在 object 列（只有这类列的深度统计与浅统计不同）。"""
+    return any(dtype == object for dtype in dataframe.dtypes)
+
+
+def to_arrow_strings(dataframe):
+    """将纯字符串的 object 列转换为 ``string[pyarrow]``，其余列保持不变。
+
+    Arrow 字符串以连续字节 + 偏移量存储，`.str` 操作与 describe 都在 C++ 中执行，
+    内存占用也能被准确统计。pyarrow 不可用或无可转换列时原样返回。
+    """
+    if not PYARROW_AVAILABLE or dataframe is None or dataframe.empty:
+        return dataframe
+    # 按位置处理，兼容重复列名；混合类型的 object 列不转换，避免改变显示内容
+    positions = [
+        i
+        for i, (_, column) in enumerate(dataframe.items())
+        if column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == "string"
+    ]
+    if not positions:
+        return dataframe
+    converted = dataframe.copy(deep=False)
+    for i in positions:
+        converted.isetitem(i, dataframe.iloc[:, i].astype("string[pyarrow]"))
+    return converted
+
+
+# data() 实际处理的角色；视图每次绘制会对每个单元格询问十余种角色，其余角色在入口直接返回。
+# 单元格不可编辑（见 flags()），因此不处理 EditRole
+_HANDLED_ROLES = frozenset((QtCore.Qt.DisplayRole, QtCore.Qt.TextAlignmentRole))
+
+_CELL_FLAGS = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+# 原地更新/翻页时只有显示文字变化（列与 dtype 不变，对齐方式不变），dataChanged 只声明该角色
+_TEXT_ROLES = [QtCore.Qt.DisplayRole]
+
+
+# ---- 按列 dtype 预先选定的单元格格式化函数，替代逐单元格的 pd.isna 泛型判断 ----
+
+def _float_fmt(value):
+    # NaN 是唯一不等于自身的值
+    return "" if value != value else str(value)
+
+
+def _datetime_fmt(value):
+    return "" if value is pd.NaT else str(value)
+
+
+def _object_fmt(value):
+    if value is None or value is pd.NA or value is pd.NaT:
+        return ""
+    if isinstance(value, float) and value != value:
+        return ""
+    return str(value)
+
+
+def _positional_values(values):
+    """返回可按位置 O(1) 取值的一维数组。
+
+    普通 numpy dtype 直接使用 ndarray（无拷贝）；日期时间与扩展类型保留 pandas
+    数组，使取出的标量仍是 Timestamp / pd.NA，显示结果与 `iloc` 一致。
+    """
+    dtype = values.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind not in "mM":
+        return values.to_numpy()
+    return values.array
+
+
+def _unboxes_exactly(values):
+    """`tolist()` 得到的 Python 标量与 numpy 标量的字符串表示是否一致。
+
+    整数、布尔与 float64 满足；float32 等转换为 Python float 后会多出位数。
+    """
+    return isinstance(values, np.ndarray) and (values.dtype.kind in "iub" or values.dtype == np.float64)
+
+
+def _formatter_for(dtype):
+    """根据列 dtype 返回对应的格式化函数。"""
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "fc":
+            return _float_fmt
+        if dtype.kind in "iub":
+            # 整数/布尔列不存在缺失值，直接使用内置 str
+            return str
+        if dtype.kind in "mM":
+            return _datetime_fmt
+    elif pd.api.types.is_datetime64_any_dtype(dtype):
+        return _datetime_fmt
+    # object 列与扩展类型（可空整数、Arrow 字符串等）可能包含 None/pd.NA
+    return _object_fmt
+
 
 class PandasTableModel(QtCore.QAbstractTableModel):
-    """用于 pandas DataFrame 的表格模型，支持分页显示。"""
+    """用于 pandas DataFrame 的表格模型，支持分页显示。
+
+    “显示全部”模式下不一次性暴露全部行，而是通过 `canFetchMore/fetchMore`
+    随滚动按批加载，视图的行数始终只覆盖已加载部分。
+    """
+
+    # 实例属性声明为槽：data()/headerData() 每个单元格都会读取其中若干项，
+    # 槽访问由类型上的描述符直接取值。SIP 基类仍保留 __dict__，未列出的属性照常可用
+    __slots__ = (
+        "_unsorted", "_dataframe", "_sort_column", "_sort_order", "_sort_positions",
+        "_page_size", "_current_page", "_show_all", "_row_offset", "_loaded_rows", "_row_count",
+        "_columns", "_index_values", "_formatters", "_unbox", "_alignments",
+        "_homogeneous_fmt", "_col_labels", "_column_count",
+        "_text_blocks", "_label_blocks", "_page_text", "_page_labels",
+    )
+
+    # “显示全部”模式下每批加载的行数
+    FETCH_BATCH_SIZE = 500
+
+    # 预先组合好的对齐标志，data() 中直接返回
+    _ALIGN_RIGHT = QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+    _ALIGN_LEFT = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+
+    # data()/headerData() 每次调用都要比较的角色常量，在类上绑定一次，
+    # 省去逐单元格的 QtCore.Qt 两级属性查找
+    _DISPLAY_ROLE = QtCore.Qt.DisplayRole
+    _ALIGNMENT_ROLE = QtCore.Qt.TextAlignmentRole
+
+    # 最多缓存的已格式化行块数（分页模式下一块即一页）
+    _MAX_CACHED_BLOCKS = 16
 
     def __init__(self, dataframe=None, parent=None):
         super(PandasTableModel, self).__init__(parent)
-        self._dataframe = dataframe if dataframe is not None else pd.DataFrame()
+        # 排序前的数据；排序列 -1 表示保持原始顺序
+        self._unsorted = dataframe if dataframe is not None else pd.DataFrame()
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.AscendingOrder
+        self._dataframe = self._unsorted
+        # 排序后第 i 行在原始数据中的位置；None 表示未排序（恒等映射）
+        self._sort_positions = None
         # 分页相关属性
         self._page_size = 10  # 默认每页 10 行
         self._current_page = 0
         self._show_all = False  # 是否显示全部
+        # 视图第 0 行对应的 DataFrame 行号；只在翻页/切换页大小/换数据时更新
+        self._row_offset = 0
+        # “显示全部”模式下已加载（暴露给视图）的行数
+        self._loaded_rows = min(self.FETCH_BATCH_SIZE, len(self._dataframe))
+        self._updateRowCount()
+        self._rebuildColumnCaches()
 
-    def rowCount(self, parent=QtCore.QModelIndex()):
-        if self._show_all:
-            return len(self._dataframe)
-        total_rows = len(self._dataframe)
-        start_row = self._current_page * self._page_size
-        return max(0, min(self._page_size, total_rows - start_row))
+    def _rebuildColumnCaches(self):
+        """按当前 DataFrame 重建逐列缓存（列数组、格式化函数、对齐方式）。"""
+        # 按列存储一维数组（列式布局），data() 直接按位置取值，绕过 iloc 的索引机制
+        self._columns = [_positional_values(column) for _, column in self._dataframe.items()]
+        index = self._dataframe.index
+        self._index_values = (
+            _positional_values(index) if not isinstance(index, pd.MultiIndex) else index
+        )
+        self._formatters = self._buildFormatters(self._dataframe)
+        self._unbox = [_unboxes_exactly(values) for values in self._columns]
+        self._alignments = self._buildAlignments(self._dataframe)
+        self._homogeneous_fmt = self._homogeneousFormatter(self._dataframe)
+        # 表头文字：列名一次性转换；行标签与单元格一样按行块懒转换
+        self._col_labels = [str(label) for label in self._dataframe.columns]
+        self._column_count = len(self._col_labels)
+        self._text_blocks = {}
+        self._label_blocks = {}
+        # 分页模式下当前页的文字块（即当前页的预切片视图），翻页时失效
+        self._page_text = None
+        self._page_labels = None
 
-    def columnCount(self, parent=QtCore.QModelIndex()):
-        return len(self._dataframe.columns)
+    def _textBlock(self, actual_row):
+        """返回包含 `actual_row` 的已格式化行块及其起始行号。
 
-    def data(self, index, role=QtCore.Qt.DisplayRole):
-        if not index.isValid():
+        行块在首次被绘制时整块格式化并缓存，此后重绘、滚动、调整列宽时
+        `data()` 只做一次数组取值，不再重复格式化。
+        """
+        block_size = self.FETCH_BATCH_SIZE if self._show_all else self._page_size
+        key = actual_row // block_size
+        start = key * block_size
+        block = self._text_blocks.get(key)
+        if block is None:
+            stop = min(start + block_size, len(self._dataframe))
+            if self._homogeneous_fmt is not None:
+                block = self._formatRowMajor(start, stop)
+            else:
+                block = np.empty((stop - start, len(self._columns)), dtype=object)
+                for j, (values, fmt) in enumerate(zip(self._columns, self._formatters)):
+                    chunk = values[start:stop]
+                    if self._unbox[j]:
+                        # 一次性转换为 Python int/float，由 C 实现的 __str__ 直接格式化，
+                        # 不再逐个经过 numpy 标量的格式化
+                        chunk = chunk.tolist()
+                    block[:, j] = list(map(fmt, chunk))
+            if len(self._text_blocks) >= self._MAX_CACHED_BLOCKS:
+                # 淘汰最早缓存的行块
+                del self._text_blocks[next(iter(self._text_blocks))]
+            self._text_blocks[key] = block
+        return block, start
+
+    def _rowLabel(self, actual_row):
+        """返回 `actual_row` 的行标签文字；所在行块的标签一次性转换并缓存。"""
+        labels, start = self._labelBlock(actual_row)
+        return labels[actual_row - start]
+
+    def _labelBlock(self, actual_row):
+        """返回包含 `actual_row` 的行标签块及其起始行号。"""
+        block_size = self.FETCH_BATCH_SIZE if self._show_all else self._page_size
+        key = actual_row // block_size
+        start = key * block_size
+        labels = self._label_blocks.get(key)
+        if labels is None:
+            # 逐个 str() 与未缓存时的显示保持一致（DatetimeIndex.astype(str) 会省略零点时间）
+            labels = [str(label) for label in self._index_values[start:start + block_size]]
+            if len(self._label_blocks) >= self._MAX_CACHED_BLOCKS:
+                del self._label_blocks[next(iter(self._label_blocks))]
+            self._label_blocks[key] = labels
+        return labels, start
+
+    def _formatRowMajor(self, start, stop):
+        """同构数值表：只把本行块复制为行主序（C-order）数组，再按行连续格式化。
+
+        pandas 的块存储按列连续，逐行取值会跨列跳跃；这里每块只复制
+        block_size × 列数 个元素，不为整表额外保留一份行主序副本。
+        """
+        # 直接从缓存的列数组切片拼接（均为 ndarray 视图），不经过 iloc 构造中间 DataFrame
+        rows = np.column_stack([values[start:stop] for values in self._columns]).tolist()
+        fmt = self._homogeneous_fmt
+        block = np.empty((stop - start, len(self._columns)), dtype=object)
+        block[:] = [[fmt(value) for value in row] for row in rows]
+        return block
+
+    @staticmethod
+    def _homogeneousFormatter(dataframe):
+        """所有列为同一 numpy 数值类型时返回共用的格式化函数，否则返回 None。
+
+        float 只接受 float64：`tolist()` 得到的 Python float 与 float64 的字符串
+        表示一致，而 float32 转换后会显示多余的位数。
+        """
+        dtypes = set(dataframe.dtypes)
+        if len(dtypes) != 1:
+            return None
+        dtype = dtypes.pop()
+        if not isinstance(dtype, np.dtype):
             return None
+        if dtype.kind in "iub":
+            return str
+        if dtype == np.float64:
+            return _float_fmt
+        return None
+
+    @staticmethod
+    def _buildFormatters(dataframe):
+        return [_formatter_for(dtype) for dtype in dataframe.dtypes]
+
+    @classmethod
+    def _buildAlignments(cls, dataframe):
+        """每列的对齐标志（数值列右对齐），只在数据变化时计算一次。
+
+        使用 Python 列表而非 numpy 布尔掩码：data() 中按列号取值即得结果，
+        不必再构造 numpy 标量并做条件判断。
+        """
+        is_numeric = pd.api.types.is_numeric_dtype
+        right, left = cls._ALIGN_RIGHT, cls._ALIGN_LEFT
+        return [right if is_numeric(dtype) else left for dtype in dataframe.dtypes]
 
-        # 计算实际行索引
-        actual_row = (
-            index.row() if self._show_all else self._current_page * self._page_size + index.row()
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        # 表格模型的单元格没有子项；Qt 每次重绘会多次调用，直接返回在状态变化时缓存的行数
+        if parent.isValid():
+            return 0
+        return self._row_count
+
+    def _pageRowCount(self, page):
+        """分页模式下第 `page` 页的行数。"""
+        start_row = page * self._page_size
+        return max(0, min(self._page_size, len(self._dataframe) - start_row))
+
+    def _updateRowCount(self):
+        """分页/加载状态变化后更新缓存的行数。"""
+        self._row_count = (
+            self._loaded_rows if self._show_all else self._pageRowCount(self._current_page)
         )
 
-        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
-            value = self._dataframe.iloc[actual_row, index.column()]
-            if pd.isna(value):
-                return ""
-            return str(value)
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or not self._show_all:
+            return False
+        return self._loaded_rows < len(self._dataframe)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        """滚动到底部时由视图调用，追加下一批行。
+
+        只在“显示全部”模式下有效；分页模式下行数由页大小决定，调用直接忽略。
+        """
+        if not self.canFetchMore(parent):
+            return
+        to_fetch = min(self.FETCH_BATCH_SIZE, len(self._dataframe) - self._loaded_rows)
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded_rows, self._loaded_rows + to_fetch - 1)
+        self._loaded_rows += to_fetch
+        self._row_count = self._loaded_rows
+        self.endInsertRows()
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._column_count
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        # 先按角色过滤（纯 Python 比较），再做跨 C++ 边界的 isValid 检查
+        if role not in _HANDLED_ROLES or not index.isValid():
+            return None
 
-        if role == QtCore.Qt.TextAlignmentRole:
+        if role == self._ALIGNMENT_ROLE:
             # 数值列右对齐，其他列左对齐
-            if pd.api.types.is_numeric_dtype(self._dataframe.iloc[:, index.column()]):
-                return QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
-            return QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+            return self._alignments[index.column()]
 
-        return None
+        # DisplayRole
+        if self._show_all:
+            row = index.row()
+            block, start = self._textBlock(row)
+            return block[row - start, index.column()]
+        # 分页模式：当前页文字块按视图行号直接取值，无需行偏移换算
+        page_text = self._page_text
+        if page_text is None:
+            page_text = self._page_text = self._textBlock(self._row_offset)[0]
+        return page_text[index.row(), index.column()]
+
+    def flags(self, index):
+        """单元格只读：可选中，不可编辑（模型没有 setData）。"""
+        return _CELL_FLAGS if index.isValid() else QtCore.Qt.NoItemFlags
 
     def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
-        if role != QtCore.Qt.DisplayRole:
+        if role != self._DISPLAY_ROLE:
             return None
         if orientation == QtCore.Qt.Horizontal:
-            return str(self._dataframe.columns[section])
+            return self._col_labels[section]
         # 垂直方向显示真实的 DataFrame 索引
-        actual_row = section if self._show_all else self._current_page * self._page_size + section
-        return str(self._dataframe.index[actual_row])
+        if self._show_all:
+            return self._rowLabel(section)
+        # 分页模式：当前页的标签列表按视图行号直接取值（页起点即标签块起点）
+        page_labels = self._page_labels
+        if page_labels is None:
+            page_labels = self._page_labels = self._labelBlock(self._row_offset)[0]
+        return page_labels[section]
 
     def setDataFrame(self, dataframe):
         """更新模型数据，并回到第一页。"""
         self.beginResetModel()
-        self._dataframe = dataframe if dataframe is not None else pd.DataFrame()
+        self._unsorted = dataframe if dataframe is not None else pd.DataFrame()
+        # 保持当前排序：新数据按同一列、同一顺序排序
+        self._applySort(self._unsorted)
         self._current_page = 0
+        self._row_offset = 0
+        self._loaded_rows = min(self.FETCH_BATCH_SIZE, len(self._dataframe))
+        self._updateRowCount()
+        self._rebuildColumnCaches()
         self.endResetModel()
 
     def getDataFrame(self):
         return self._dataframe
 
+    def isCompatible(self, dataframe):
+        """`dataframe` 与当前（未排序的）数据形状、列标签、dtype 是否都相同。"""
+        current = self._unsorted
+        return (
+            dataframe.shape == current.shape
+            and dataframe.columns.equals(current.columns)
+            and dataframe.dtypes.equals(current.dtypes)
+        )
+
+    def updateDataFrame(self, dataframe):
+        """用同形状、同列的新数据原地替换，保留页码与视图状态。
+
+        只通知当前可见范围的数据与垂直表头发生变化，不重置模型；
+        数据不兼容时退回 `setDataFrame`。
+        """
+        if not self.isCompatible(dataframe):
+            self.setDataFrame(dataframe)
+            return
+        self._unsorted = dataframe
+        self._applySort(dataframe)
+        self._rebuildColumnCaches()
+        if self._row_count and self._column_count:
+            last_row = self._row_count - 1
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(last_row, self._column_count - 1), _TEXT_ROLES
+            )
+            self.headerDataChanged.emit(QtCore.Qt.Vertical, 0, last_row)
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """按列排序（由视图表头点击触发），column < 0 时恢复原始顺序。
+
+        在 pandas 中对整列做一次稳定排序，视图只需渲染已排好序的当前页，
+        无需代理模型逐行调用 `data()` 比较。行数与列结构不变，因此只发出
+        layoutChanged 而不重置模型，列宽与表头状态得以保留。
+        视图的选择与当前项（持久索引）随所在行移动到新位置。
+        """
+        self.layoutAboutToBeChanged.emit()
+        old_positions = self._sort_positions
+        self._sort_column = column
+        self._sort_order = order
+        self._applySort(self._unsorted)
+        self._rebuildColumnCaches()
+        persistent = self.persistentIndexList()
+        if persistent:
+            self.changePersistentIndexList(persistent, self._remapRows(persistent, old_positions))
+        self.layoutChanged.emit()
+
+    def _remapRows(self, indexes, old_positions):
+        """把排序前的模型索引换算为同一数据行排序后的索引。
+
+        行号经由原始数据中的位置换算（向量化），移出当前可见范围的行返回无效索引。
+        """
+        offset = self._row_offset
+        rows = np.fromiter((index.row() for index in indexes), dtype=np.intp, count=len(indexes)) + offset
+        if old_positions is not None:
+            rows = old_positions[rows]
+        new_positions = self._sort_positions
+        if new_positions is not None:
+            inverse = np.empty(len(new_positions), dtype=np.intp)
+            inverse[new_positions] = np.arange(len(new_positions), dtype=np.intp)
+            rows = inverse[rows]
+        rows -= offset
+        row_count = self._row_count
+        return [
+            self.index(int(row), index.column()) if 0 <= row < row_count else QtCore.QModelIndex()
+            for row, index in zip(rows, indexes)
+        ]
+
+    def _applySort(self, dataframe):
+        """按当前排序状态设置 `_dataframe` 与 `_sort_positions`。"""
+        positions = self._sortPositions(dataframe)
+        self._sort_positions = positions
+        self._dataframe = dataframe if positions is None else dataframe.iloc[positions]
+
+    def _sortPositions(self, dataframe):
+        """按当前排序状态返回排序后各行在 `dataframe` 中的位置（按位置取列，兼容重复列名）。
+
+        不需要排序时返回 None。
+        """
+        column = self._sort_column
+        if column < 0 or column >= dataframe.shape[1] or len(dataframe) < 2:
+            return None
+        keys = dataframe.iloc[:, column].reset_index(drop=True)
+        ascending = self._sort_order == QtCore.Qt.AscendingOrder
+        try:
+            positions = keys.sort_values(ascending=ascending, kind="mergesort").index
+        except TypeError:
+            # 混合类型的 object 列无法直接比较，按显示文本排序
+            positions = keys.astype(str).sort_values(ascending=ascending, kind="mergesort").index
+        return positions.to_numpy(dtype=np.intp)
+
     def setPageSize(self, size):
-        """设置每页行数，-1 表示显示全部。"""
+        """设置每页行数，-1 表示显示全部（按批增量加载），并回到第一页。"""
         if size == -1:
-            self._show_all = True
+            self._setVisibleWindow(True, self._page_size, 0)
         else:
-            self._show_all = False
-            self._page_size = size
-        self._current_page = 0
-        self.beginResetModel()
-        self.endResetModel()
+            self._setVisibleWindow(False, size, 0)
 
     def setCurrentPage(self, page):
         """设置当前页。"""
-        self._current_page = max(0, int(page))
-        self.beginResetModel()
-        self.endResetModel()
+        self._setVisibleWindow(self._show_all, self._page_size, max(0, int(page)))
+
+    def _setVisibleWindow(self, show_all, page_size, page):
+        """切换分页模式/页大小/页码，并以最小的变更通知视图。
+
+        不重置模型，分三步进行，每一步都满足模型契约：
+        1. 行数减少时，先在旧内容上移除多出的行；
+        2. 切换到新窗口的内容（行数不变）；可见行对应的数据行变化时，
+           持久索引（选择、当前项）置为无效，而不是停留在显示其他数据的同一行号上；
+        3. 行数增加时，在新内容上插入新增的行。
+        保留下来的行随后发出 dataChanged 与垂直表头更新，列宽与滚动位置得以保留。
+        """
+        old_rows = self._row_count
+        total = len(self._dataframe)
+        if show_all:
+            # 切换到“显示全部”时从第一批开始加载；已处于该模式时保持已加载的行
+            loaded_rows = self._loaded_rows if self._show_all else min(self.FETCH_BATCH_SIZE, total)
+            new_rows = loaded_rows
+        else:
+            loaded_rows = self._loaded_rows
+            new_rows = max(0, min(page_size, total - page * page_size))
+        row_offset = 0 if show_all else page * page_size
+        common = min(old_rows, new_rows)
+        root = QtCore.QModelIndex()
+
+        if new_rows < old_rows:
+            self.beginRemoveRows(root, new_rows, old_rows - 1)
+            self._row_count = new_rows
+            self.endRemoveRows()
+
+        content_changed = row_offset != self._row_offset
+        if content_changed:
+            self.layoutAboutToBeChanged.emit()
+
+        if show_all != self._show_all or page_size != self._page_size:
+            # 行块大小随模式/页大小变化，已缓存的行块失效
+            self._text_blocks = {}
+            self._label_blocks = {}
+        self._show_all = show_all
+        self._page_size = page_size
+        self._current_page = page
+        self._row_offset = row_offset
+        self._loaded_rows = loaded_rows
+        # 分页模式下当前页的文字块（即当前页的预切片视图），翻页时失效
+        self._page_text = None
+        self._page_labels = None
+
+        if content_changed:
+            # 选择模型等在 layoutAboutToBeChanged 中才创建持久索引，因此在发出之后再取
+            persistent = self.persistentIndexList()
+            if persistent:
+                self.changePersistentIndexList(persistent, [QtCore.QModelIndex()] * len(persistent))
+            self.layoutChanged.emit()
+
+        if new_rows > old_rows:
+            self.beginInsertRows(root, old_rows, new_rows - 1)
+            self._row_count = new_rows
+            self.endInsertRows()
+
+        if content_changed and common and self._column_count:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(common - 1, self._column_count - 1), _TEXT_ROLES
+            )
+            self.headerDataChanged.emit(QtCore.Qt.Vertical, 0, common - 1)
 
     def getTotalPages(self):
         """获取总页数。显示全部或空数据时返回 1。"""
@@ -98,6 +570,10 @@ class PandasTableModel(QtCore.QAbstractTableModel):
     def getCurrentPage(self):
         return self._current_page
 
+    def getRowOffset(self):
+        """当前页第一行在 DataFrame 中的行号。"""
+        return self._row_offset
+
     def getPageSize(self):
         return self._page_size if not self._show_all else -1
 
@@ -0,0 +1,82 @@
+"""
+表格搜索索引。
+
+目的：
+- 每个 DataFrame 只构建一次“整行文本”索引，之后每次搜索都是一次向量化的子串匹配，
+  得到的行掩码直接用于筛选 DataFrame，不再由代理模型逐单元格调用 `data()` 进行过滤。
+- 超大表（行数 >= NUMBA_MIN_ROWS）且安装了 numba 时，使用 JIT 编译的并行扫描内核。
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 行数达到该阈值才启用 numba 内核；小表上 JIT 与编码缓冲区的开销得不偿失
+NUMBA_MIN_ROWS = 200_000
+
+# 单元格之间的分隔符，避免搜索文本跨列匹配
+_CELL_SEPARATOR = "\x1f"
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, parallel=True, nogil=True)
+    def _contains_kernel(buffer, offsets, needle):
+        """对每一行的 UTF-8 字节区间做朴素子串扫描，返回布尔掩码。"""
+        n_rows = offsets.shape[0] - 1
+        n_needle = needle.shape[0]
+        out = np.zeros(n_rows, dtype=np.bool_)
+        for i in numba.prange(n_rows):
+            stop = offsets[i + 1] - n_needle + 1
+            for j in range(offsets[i], stop):
+                k = 0
+                while k < n_needle and buffer[j + k] == needle[k]:
+                    k += 1
+                if k == n_needle:
+                    out[i] = True
+                    break
+        return out
+
+
+class SearchIndex:
+    """DataFrame 的整行小写文本索引，支持大小写不敏感的子串搜索。"""
+
+    def __init__(self, dataframe):
+        self.dataframe = dataframe
+        parts = [
+            column.astype(str).where(column.notna(), "").to_numpy()
+            for _, column in dataframe.items()
+        ]
+        texts = pd.Series(parts[0] if parts else [""] * len(dataframe), dtype=object)
+        if len(parts) > 1:
+            texts = texts.str.cat(parts[1:], sep=_CELL_SEPARATOR)
+        self._texts = texts.str.lower()
+        # numba 内核使用的连续字节缓冲区与行偏移，首次需要时才构建
+        self._buffer = None
+        self._offsets = None
+
+    def mask(self, text):
+        """返回每行是否包含 `text` 的布尔数组；空文本返回 None（不过滤）。"""
+        if not text:
+            return None
+        needle = text.lower()
+        if NUMBA_AVAILABLE and len(self._texts) >= NUMBA_MIN_ROWS:
+            buffer, offsets = self._byteBuffers()
+            needle_bytes = np.frombuffer(needle.encode("utf-8"), dtype=np.uint8)
+            return _contains_kernel(buffer, offsets, needle_bytes)
+        return self._texts.str.contains(needle, regex=False).to_numpy(dtype=bool)
+
+    def _byteBuffers(self):
+        if self._buffer is None:
+            encoded = [t.encode("utf-8") for t in self._texts]
+            lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+            self._offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=self._offsets[1:])
+            self._buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return self._buffer, self._offsets
+
@@ -0,0 +1,57 @@
+"""
+静态 Figure 视图。
+
+目的：
+- 只需查看、无需交互（缩放/平移）的 Figure 由 Agg 后端栅格化一次，以 QPixmap 显示在 QLabel 中。
+- 不创建 FigureCanvasQTAgg 与工具栏：没有嵌入式画布的事件回调需要清理，
+  也不会在每次 Qt 重绘时重新执行 artist 布局。
+"""
+
+from qtpy import QtWidgets, QtCore, QtGui
+
+
+class StaticFigureView(QtWidgets.QLabel):
+    """以位图方式显示 Figure；接口与 PlotViewerWidget 的 setFigure/clear 保持一致。"""
+
+    def __init__(self, parent=None):
+        super(StaticFigureView, self).__init__(parent)
+        self.current_figure = None
+        # 没有交互式画布；调用方据此判断只能通过 setFigure 重新栅格化
+        self.canvas = None
+        self.setAlignment(QtCore.Qt.AlignCenter)
+        self.setStyleSheet("color: #999; font-size: 14px;")
+        self.setText("No plot to display")
+
+    def setFigure(self, figure):
+        """栅格化并显示 Figure；None 表示清空。"""
+        if figure is None:
+            self.clear()
+            return
+        try:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+        except ImportError:
+            self.current_figure = None
+            self.setText("Matplotlib is not available")
+            return
+
+        # FigureCanvasAgg 会接管 figure.canvas，渲染完成后还原，避免影响其他地方的显示
+        original = figure.canvas
+        try:
+            canvas = FigureCanvasAgg(figure)
+            canvas.draw()
+            buf = canvas.buffer_rgba()
+            height, width = buf.shape[:2]
+            image = QtGui.QImage(buf, width, height, QtGui.QImage.Format_RGBA8888)
+            # fromImage 会复制像素数据，之后不再依赖 Agg 缓冲区
+            pixmap = QtGui.QPixmap.fromImage(image)
+        finally:
+            figure.set_canvas(original)
+
+        self.current_figure = figure
+        self.setPixmap(pixmap)
+
+    def clear(self):
+        """清空显示的位图。"""
+        self.current_figure = None
+        super(StaticFigureView, self).clear()
+        self.setText("No plot to display")
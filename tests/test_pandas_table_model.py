@@ -0,0 +1,113 @@
+"""PandasTableModel 的模型契约测试（QAbstractItemModelTester）。"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+QtTest = pytest.importorskip("qtpy.QtTest")
+from qtpy import QtCore, QtWidgets  # noqa: E402
+
+from PandasPackage.UI._pandas_table_model import PandasTableModel  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def qt_warnings(app):
+    """收集测试期间的 Qt 警告；QAbstractItemModelTester 以 Warning 模式报告违约。"""
+    messages = []
+
+    def handler(msg_type, context, message):
+        if msg_type != QtCore.QtMsgType.QtDebugMsg:
+            messages.append(message)
+
+    previous = QtCore.qInstallMessageHandler(handler)
+    yield messages
+    QtCore.qInstallMessageHandler(previous)
+
+
+def _tested_model(rows=2500):
+    dataframe = pd.DataFrame({"a": range(rows), "b": [f"s{i}" for i in range(rows)]})
+    model = PandasTableModel(dataframe)
+    tester = QtTest.QAbstractItemModelTester(
+        model, QtTest.QAbstractItemModelTester.FailureReportingMode.Warning
+    )
+    return model, tester
+
+
+def test_fetch_more_is_ignored_in_paged_mode(qt_warnings):
+    model, tester = _tested_model()
+    model.setPageSize(10)
+    root = QtCore.QModelIndex()
+
+    assert not model.canFetchMore(root)
+    model.fetchMore(root)
+
+    assert model.rowCount() == 10
+    assert model.headerData(9, QtCore.Qt.Vertical) == "9"
+    assert qt_warnings == []
+
+
+def test_fetch_more_appends_batch_in_show_all_mode(app):
+    # 不挂 QAbstractItemModelTester：它在处理 rowsInserted 时会自行调用 fetchMore，
+    # 追加下一批后再与自己记录的行数比较，必然报告不一致
+    dataframe = pd.DataFrame({"a": range(2500)})
+    model = PandasTableModel(dataframe)
+    model.setPageSize(-1)
+    root = QtCore.QModelIndex()
+
+    assert model.rowCount() == PandasTableModel.FETCH_BATCH_SIZE
+    assert model.canFetchMore(root)
+    model.fetchMore(root)
+
+    assert model.rowCount() == 2 * PandasTableModel.FETCH_BATCH_SIZE
+
+
+def test_paging_keeps_model_contract(qt_warnings):
+    model, tester = _tested_model(rows=25)
+    model.setPageSize(10)
+
+    model.setCurrentPage(1)
+    assert model.rowCount() == 10
+    assert model.headerData(0, QtCore.Qt.Vertical) == "10"
+
+    # 最后一页只有 5 行：移除多出的行
+    model.setCurrentPage(2)
+    assert model.rowCount() == 5
+    assert model.data(model.index(0, 0)) == "20"
+
+    # 回到整页：插入新增的行
+    model.setCurrentPage(0)
+    assert model.rowCount() == 10
+    assert model.data(model.index(9, 1)) == "s9"
+
+    model.setPageSize(-1)
+    assert model.rowCount() == 25
+    model.setPageSize(5)
+    assert model.rowCount() == 5
+    assert qt_warnings == []
+
+
+def test_page_change_invalidates_persistent_indexes(qt_warnings):
+    model, tester = _tested_model(rows=25)
+    model.setPageSize(10)
+    selected = QtCore.QPersistentModelIndex(model.index(3, 0))
+
+    model.setCurrentPage(1)
+
+    assert not selected.isValid()
+    assert qt_warnings == []
+
+
+def test_page_size_change_keeps_persistent_indexes_on_same_rows(qt_warnings):
+    model, tester = _tested_model(rows=25)
+    model.setPageSize(10)
+    selected = QtCore.QPersistentModelIndex(model.index(3, 0))
+
+    # 仍在第一页，第 3 行显示的数据不变
+    model.setPageSize(20)
+
+    assert selected.isValid() and selected.row() == 3
+    assert qt_warnings == []